@@ -9,13 +9,20 @@ and its interactions with the data models.
 """
 
 import os
+import sys
+import weakref
 from PySide6.QtWidgets import QWidget, QVBoxLayout
-from PySide6.QtCore import QObject, Signal, Slot, Qt
+from PySide6.QtCore import QObject, Signal, Slot, Qt, QTimer, QThreadPool
 
 import pandas as pd
 import numpy as np
 
-from views.dashboard_view import DashboardView
+from views.dashboard_view import DashboardView, PLAYER_ROW_COLUMNS
+from utils.workers import Worker
+
+
+# Delay used to coalesce rapid league/season changes into a single fetch
+FETCH_DEBOUNCE_MS = 250
 
 
 class DashboardController(QObject):
@@ -44,6 +51,28 @@ class DashboardController(QObject):
         self.api_client = api_client
         self.data_processor = data_processor
         
+        # Cached metrics as (weak reference to the source DataFrame, metrics DataFrame)
+        self._metrics_cache = (None, None)
+        
+        # Cached league-wide card values, keyed like the metrics cache
+        self._league_stats_cache = (None, None)
+        
+        # Fingerprint of the last DataFrame shown, used to skip redundant updates
+        self._last_df_fingerprint = None
+        
+        # Incremented per dashboard update so results of superseded workers are dropped
+        self._dashboard_generation = 0
+        
+        # Weak reference to the DataFrame the running dashboard update was started for
+        self._dashboard_source = None
+        
+        # Debounce timer for league/season changes; only the last selection is fetched
+        self._pending_fetch = {}
+        self._fetch_timer = QTimer(self)
+        self._fetch_timer.setSingleShot(True)
+        self._fetch_timer.setInterval(FETCH_DEBOUNCE_MS)
+        self._fetch_timer.timeout.connect(self._do_fetch)
+        
         # Create the dashboard view
         self.view = DashboardView()
         
@@ -66,15 +95,146 @@ class DashboardController(QObject):
         if players_df is None or len(players_df) == 0:
             return
         
-        # Calculate additional metrics
-        stats_df = self.data_processor.calculate_player_metrics(players_df)
+        # Nothing to do if the same data is already displayed
+        fingerprint = (
+            id(players_df),
+            len(players_df),
+            float(players_df['rating'].sum()) if 'rating' in players_df.columns else 0
+        )
+        if fingerprint == self._last_df_fingerprint:
+            return
+        self._last_df_fingerprint = fingerprint
+        
+        # Reuse cached results for the same DataFrame object (the caches are only touched on this thread)
+        stats_df = self.cached(self._metrics_cache, players_df)
+        league_stats = self.cached(self._league_stats_cache, players_df)
+        
+        # The worker gets its own copy, so it never races with other users of the shared frame
+        source_df = players_df.copy() if stats_df is None or league_stats is None else None
+        
+        # Reduce the data on a worker thread; the view is updated when it is done
+        self._dashboard_generation += 1
+        self._dashboard_source = weakref.ref(players_df)
+        worker = Worker(
+            self.build_dashboard_data,
+            source_df,
+            self._dashboard_generation,
+            stats_df,
+            league_stats
+        )
+        worker.signals.finished.connect(self.on_dashboard_data_ready)
+        worker.signals.error.connect(self.on_dashboard_data_error)
+        QThreadPool.globalInstance().start(worker)
+    
+    def build_dashboard_data(self, players_df, generation, stats_df=None, league_stats=None):
+        """
+        Compute everything the dashboard displays. Runs on a worker thread.
+        
+        Args:
+            players_df (pd.DataFrame): Private copy of the player data, or None if
+                both stats_df and league_stats are given
+            generation (int): Dashboard update this data belongs to
+            stats_df (pd.DataFrame, optional): Cached player metrics. Defaults to None.
+            league_stats (dict, optional): Cached league statistics. Defaults to None.
+        
+        Returns:
+            tuple: (generation, player metrics, league stats,
+                dict with league_stats, top_players and chart_data)
+        """
+        # Calculate additional metrics and league stats unless they were cached
+        if stats_df is None:
+            stats_df = self.data_processor.calculate_player_metrics(players_df)
+        if league_stats is None:
+            league_stats = self.compute_league_stats(players_df)
+        
+        return generation, stats_df, league_stats, {
+            'league_stats': league_stats,
+            'top_players': self.player_columns(self.select_top_players(stats_df)),
+            'chart_data': self.prepare_chart_data(stats_df)
+        }
+    
+    @Slot(object)
+    def on_dashboard_data_ready(self, result):
+        """
+        Update the view with data computed by build_dashboard_data.
+        
+        Args:
+            result (tuple): (generation, player metrics, league stats, dashboard data)
+        """
+        generation, stats_df, league_stats, dashboard_data = result
+        if generation != self._dashboard_generation:
+            return
+        
+        # Cache the results for the DataFrame this update was started for
+        self._metrics_cache = (self._dashboard_source, stats_df)
+        self._league_stats_cache = (self._dashboard_source, league_stats)
+        
+        self.view.update_league_stats(dashboard_data['league_stats'])
+        self.view.update_top_players(dashboard_data['top_players'])
+        self.view.update_charts(dashboard_data['chart_data'])
+    
+    @Slot(str)
+    def on_dashboard_data_error(self, message):
+        """
+        Handle a failure while computing the dashboard data.
+        
+        Args:
+            message (str): Error message
+        """
+        print(f"Error updating dashboard: {message}")
+        self._last_df_fingerprint = None
+    
+    @staticmethod
+    def cached(cache, players_df):
+        """
+        Get a cached result if it was computed for the same DataFrame object.
+        
+        Args:
+            cache (tuple): (weak reference to the source DataFrame, cached value)
+            players_df (pd.DataFrame): Current DataFrame
+        
+        Returns:
+            object: Cached value, or None if the DataFrame differs
+        """
+        source_ref, value = cache
+        return value if source_ref is not None and source_ref() is players_df else None
+    
+    def compute_league_stats(self, players_df):
+        """
+        Compute the league-wide aggregates shown in the statistics cards.
         
-        # Update the top players section
-        self.update_top_players(stats_df)
+        Args:
+            players_df (pd.DataFrame): DataFrame with player data
         
-        # Prepare and update chart data
-        chart_data = self.prepare_chart_data(stats_df)
-        self.view.update_charts(chart_data)
+        Returns:
+            dict: Mapping of card key to (value, subtitle)
+        """
+        league_stats = {'total_players': (len(players_df), None)}
+        
+        if 'goals_total' in players_df.columns:
+            goals = players_df['goals_total']
+            
+            # Goals per appearance across the league
+            if 'appearances' in players_df.columns:
+                appearances = players_df['appearances'].sum()
+                if appearances > 0:
+                    league_stats['average_goals'] = (f"{goals.sum() / appearances:.2f}", "Per appearance")
+            
+            # Top scorer
+            if 'name' in players_df.columns and len(players_df) > 0:
+                top_idx = goals.to_numpy().argmax()
+                league_stats['top_scorer'] = (
+                    players_df['name'].iloc[top_idx],
+                    f"{int(goals.iloc[top_idx])} goals"
+                )
+        
+        return league_stats
+    
+    def invalidate_metrics_cache(self):
+        """Drop the cached player metrics and league stats so the next update recomputes them."""
+        self._metrics_cache = (None, None)
+        self._league_stats_cache = (None, None)
+        self._last_df_fingerprint = None
     
     def update_top_players(self, players_df):
         """
@@ -83,11 +243,52 @@ class DashboardController(QObject):
         Args:
             players_df (pd.DataFrame): DataFrame with player data
         """
-        # Get top 10 players by rating
-        top_players = players_df.sort_values(by='rating', ascending=False).head(10)
+        self.view.update_top_players(self.player_columns(self.select_top_players(players_df)))
+    
+    def player_columns(self, players_df):
+        """
+        Convert the columns shown in player rows to plain lists, once per column.
+        
+        Args:
+            players_df (pd.DataFrame): DataFrame with player data
         
-        # Update the view
-        self.view.update_top_players(top_players)
+        Returns:
+            dict: Column name to list of values, for the available PLAYER_ROW_COLUMNS
+        """
+        columns = {
+            col: players_df[col].tolist()
+            for col in PLAYER_ROW_COLUMNS
+            if col in players_df.columns
+        }
+        
+        # Players of the same team share one team name string
+        if 'team_name' in columns:
+            columns['team_name'] = [sys.intern(str(team)) for team in columns['team_name']]
+        
+        return columns
+    
+    def select_top_players(self, players_df):
+        """
+        Select the top 10 players by rating.
+        
+        Args:
+            players_df (pd.DataFrame): DataFrame with player data
+        
+        Returns:
+            pd.DataFrame: Top players, best first
+        """
+        # Get top 10 players by rating (partial selection instead of a full sort)
+        if 'rating' not in players_df.columns:
+            top_players = players_df.head(10)
+        elif len(players_df) <= 10:
+            top_players = players_df.sort_values(by='rating', ascending=False)
+        else:
+            ratings = players_df['rating'].to_numpy(dtype=float)
+            top_idx = np.argpartition(ratings, -10)[-10:]
+            top_idx = top_idx[np.argsort(-ratings[top_idx], kind='stable')]
+            top_players = players_df.iloc[top_idx]
+        
+        return top_players
     
     def prepare_chart_data(self, players_df):
         """
@@ -101,15 +302,31 @@ class DashboardController(QObject):
         """
         chart_data = {}
         
-        # Position distribution
         if 'position' in players_df.columns:
-            position_counts = players_df['position'].value_counts().to_dict()
-            chart_data['position_distribution'] = position_counts
-        
-        # Goals per position
-        if 'position' in players_df.columns and 'goals_total' in players_df.columns:
-            goals_by_position = players_df.groupby('position')['goals_total'].sum().to_dict()
-            chart_data['goals_per_position'] = goals_by_position
+            # Encode positions as small ints once (category codes when available)
+            position = players_df['position']
+            if isinstance(position.dtype, pd.CategoricalDtype):
+                codes = position.cat.codes.to_numpy()
+                names = np.asarray(position.cat.categories, dtype=object)
+            else:
+                codes, names = pd.factorize(position)
+                names = np.asarray(names, dtype=object)
+            valid = codes >= 0
+            codes = codes[valid]
+            
+            # Position distribution, most common first, without empty positions
+            counts = np.bincount(codes, minlength=len(names))
+            order = np.argsort(-counts, kind='stable')
+            order = order[counts[order] > 0]
+            chart_data['position_distribution'] = dict(zip(names[order].tolist(), counts[order].tolist()))
+            
+            # Goals per position
+            if 'goals_total' in players_df.columns:
+                goals = players_df['goals_total'].to_numpy(dtype=np.float64)[valid]
+                goals_by_position = np.bincount(codes, weights=goals, minlength=len(names))
+                chart_data['goals_per_position'] = dict(
+                    zip(names[order].tolist(), goals_by_position[order].round().astype(np.int64).tolist())
+                )
         
         # Additional chart data can be prepared here
         
@@ -123,8 +340,11 @@ class DashboardController(QObject):
         Args:
             league_id (int): Selected league ID
         """
-        # Fetch data for the selected league
-        self.api_client.get_top_players(league_id=league_id)
+        self.invalidate_metrics_cache()
+        
+        # Schedule a fetch for the selected league
+        self._pending_fetch['league_id'] = league_id
+        self._fetch_timer.start()
     
     @Slot(int)
     def on_season_changed(self, season):
@@ -134,9 +354,18 @@ class DashboardController(QObject):
         Args:
             season (int): Selected season year
         """
-        # Fetch data for the selected season
-        league_id = self.get_current_league_id()
-        self.api_client.get_top_players(league_id=league_id, season=season)
+        self.invalidate_metrics_cache()
+        
+        # Schedule a fetch for the selected season
+        self._pending_fetch.setdefault('league_id', self.get_current_league_id())
+        self._pending_fetch['season'] = season
+        self._fetch_timer.start()
+    
+    @Slot()
+    def _do_fetch(self):
+        """Fetch top players for the most recent league/season selection."""
+        params, self._pending_fetch = self._pending_fetch, {}
+        self.api_client.get_top_players(**params)
     
     @Slot()
     def on_apply_filters(self):
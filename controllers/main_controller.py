@@ -11,7 +11,8 @@ It coordinates between the UI views and the data models.
 from PySide6.QtWidgets import (
     QMainWindow, QMessageBox, QDialog, QFileDialog, QProgressDialog
 )
-from PySide6.QtCore import QObject, Signal, Slot, QTimer
+from PySide6.QtCore import Qt, QObject, Signal, Slot, QTimer
+from PySide6.QtGui import QStandardItemModel, QStandardItem
 from PySide6.QtUiTools import QUiLoader
 import os
 
@@ -25,6 +26,18 @@ from controllers.player_controller import PlayerController
 from views.player_view import PlayerView
 from views.settings_dialog import SettingsDialog
 
+from utils.config import load_config, KEY_API_SOURCE, KEY_API_KEY, KEY_CURRENT_SEASON
+
+
+# Settings that change which data the API returns
+DATA_CONFIG_KEYS = (KEY_API_SOURCE, KEY_API_KEY, KEY_CURRENT_SEASON)
+
+# Settings the API client's endpoint is configured from
+API_CONFIG_KEYS = (KEY_API_SOURCE, KEY_API_KEY)
+
+# Delay after the first paint before the settings dialog is prepared in the background
+SETTINGS_WARMUP_DELAY_MS = 2000
+
 
 class MainController(QMainWindow):
     """
@@ -53,24 +66,85 @@ class MainController(QMainWindow):
         self.data_processor = DataProcessor()
         self.recommender = PlayerRecommender()
         
-        # Initialize controllers
-        self.dashboard_controller = DashboardController(
-            self.ui.tab_dashboard,
-            self.api_client,
-            self.data_processor
-        )
-        self.player_controller = PlayerController(
-            self.recommender
-        )
+        # Settings the current data was loaded with
+        self._last_config = dict(load_config())
+        
+        # Controllers are created on first use (see the properties below)
+        self._dashboard_controller = None
+        self._player_controller = None
+        self._settings_dialog = None
+        self._initial_data_requested = False
         
         # Connect signals and slots
         self.connect_signals()
         
         # Set up initial UI state
         self.setup_ui()
+    
+    @property
+    def dashboard_controller(self):
+        """DashboardController: Dashboard controller, created on first access."""
+        return self.ensure_dashboard_controller()
+    
+    def ensure_dashboard_controller(self):
+        """
+        Create the dashboard controller and its view if they don't exist yet.
         
-        # Load initial data
+        Returns:
+            DashboardController: Dashboard controller
+        """
+        if self._dashboard_controller is None:
+            self._dashboard_controller = DashboardController(
+                self.ui.tab_dashboard,
+                self.api_client,
+                self.data_processor
+            )
+            self._dashboard_controller.player_selected.connect(self.on_player_selected)
+        return self._dashboard_controller
+    
+    @property
+    def settings_dialog(self):
+        """SettingsDialog: Settings dialog, created on first access and reused across opens."""
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(
+                self,
+                clear_cache=self.api_client.clear_cache,
+                validate_key=self.api_client.validate_key
+            )
+            # Queued, so the dialog closes before the new settings are applied
+            self._settings_dialog.settings_changed.connect(self.on_settings_changed, Qt.QueuedConnection)
+        return self._settings_dialog
+    
+    @property
+    def player_controller(self):
+        """PlayerController: Player controller, created on first access."""
+        if self._player_controller is None:
+            self._player_controller = PlayerController(
+                self.recommender
+            )
+        return self._player_controller
+    
+    def showEvent(self, event):
+        """Defer dashboard construction and the initial fetch until after the first paint."""
+        super().showEvent(event)
+        
+        if not self._initial_data_requested:
+            self._initial_data_requested = True
+            QTimer.singleShot(0, self.on_first_show)
+    
+    @Slot()
+    def on_first_show(self):
+        """Build the visible tab and load initial data once the window is on screen."""
+        self.on_tab_changed(self.ui.tabWidget.currentIndex())
         self.load_initial_data()
+        
+        # Prepare the settings dialog while idle so its first open is instant
+        QTimer.singleShot(SETTINGS_WARMUP_DELAY_MS, self.warm_settings_dialog)
+    
+    @Slot()
+    def warm_settings_dialog(self):
+        """Create the settings dialog and its widgets ahead of the first open."""
+        self.settings_dialog.build()
     
     def connect_signals(self):
         """Connect signals and slots."""
@@ -88,9 +162,6 @@ class MainController(QMainWindow):
         self.recommender.recommendation_ready.connect(self.on_recommendations_ready)
         self.recommender.error_occurred.connect(self.show_error)
         
-        # Dashboard controller signals
-        self.dashboard_controller.player_selected.connect(self.on_player_selected)
-        
         # UI signals
         self.ui.actionSettings.triggered.connect(self.show_settings)
         self.ui.actionAbout.triggered.connect(self.show_about)
@@ -109,25 +180,50 @@ class MainController(QMainWindow):
     def setup_ui(self):
         """Set up the initial UI state."""
         # Populate league combobox
-        self.ui.comboBox_league.addItem("Premier League", 39)
-        self.ui.comboBox_league.addItem("La Liga", 140)
-        self.ui.comboBox_league.addItem("Bundesliga", 78)
-        self.ui.comboBox_league.addItem("Serie A", 135)
-        self.ui.comboBox_league.addItem("Ligue 1", 61)
+        self.leagues_model = self.create_combo_model([
+            ("Premier League", 39),
+            ("La Liga", 140),
+            ("Bundesliga", 78),
+            ("Serie A", 135),
+            ("Ligue 1", 61)
+        ])
+        self.ui.comboBox_league.setModel(self.leagues_model)
         
         # Populate season combobox
-        for season in range(2023, 2019, -1):
-            self.ui.comboBox_season.addItem(str(season), season)
+        self.seasons_model = self.create_combo_model(
+            [(str(season), season) for season in range(2023, 2019, -1)]
+        )
+        self.ui.comboBox_season.setModel(self.seasons_model)
         
-        # Populate position comboboxes
+        # Populate position comboboxes from one shared model
         positions = ["All Positions", "Goalkeeper", "Defender", "Midfielder", "Forward"]
+        self.positions_model = self.create_combo_model([(position, None) for position in positions])
         for combo in [self.ui.comboBox_position, self.ui.comboBox_position_2, self.ui.comboBox_position_3]:
-            for position in positions:
-                combo.addItem(position)
+            combo.setModel(self.positions_model)
         
         # Set status
         self.ui.label_status.setText("Ready")
     
+    def create_combo_model(self, items):
+        """
+        Build a combobox model in one pass.
+        
+        Args:
+            items (list): (text, user data) tuples; user data is exposed via currentData()
+        
+        Returns:
+            QStandardItemModel: Model to set on one or more comboboxes
+        """
+        model = QStandardItemModel(self)
+        rows = []
+        for text, data in items:
+            item = QStandardItem(text)
+            if data is not None:
+                item.setData(data, Qt.UserRole)
+            rows.append(item)
+        model.invisibleRootItem().appendRows(rows)
+        return model
+    
     def load_initial_data(self):
         """Load initial data when the application starts."""
         league_id = self.ui.comboBox_league.currentData()
@@ -161,8 +257,8 @@ class MainController(QMainWindow):
         # Set data for the recommender
         self.recommender.set_data(processed_data)
         
-        # Train recommender models
-        QTimer.singleShot(100, self.recommender.train_models)
+        # Train recommender models on a worker thread to keep the UI responsive
+        self.recommender.start_training()
     
     @Slot(object)
     def on_recommendations_ready(self, recommendations):
@@ -198,11 +294,8 @@ class MainController(QMainWindow):
         player = self.data_processor.get_player_by_id(player_id)
         
         if player is not None:
-            # Convert Series to dict
-            player_data = player.to_dict()
-            
-            # Show player profile
-            self.player_controller.show_player_profile(player_data)
+            # Show player profile (the view reads the Series directly)
+            self.player_controller.show_player_profile(player)
     
     @Slot(int)
     def on_tab_changed(self, index):
@@ -212,8 +305,9 @@ class MainController(QMainWindow):
         Args:
             index (int): Index of the selected tab
         """
-        # Handle specific actions when switching to different tabs
-        pass
+        # Build tab-specific controllers the first time their tab is shown
+        if self.ui.tabWidget.widget(index) is self.ui.tab_dashboard:
+            self.ensure_dashboard_controller()
     
     @Slot()
     def on_search_clicked(self):
@@ -288,13 +382,11 @@ class MainController(QMainWindow):
         if reference_player:
             # Search for the player in the database
             # This is a simplified approach - in a real app, you'd want a more robust search
-            found_players = self.data_processor.players_df[
-                self.data_processor.players_df['name'].str.contains(reference_player, case=False)
-            ]
+            found_rows = self.data_processor.find_player_rows(reference_player)
             
-            if len(found_players) > 0:
+            if found_rows:
                 # Use the first matching player
-                player_id = found_players.iloc[0]['player_id']
+                player_id = self.data_processor.players_df['player_id'].iat[found_rows[0]]
                 self.recommender.recommend_similar_players(player_id)
             else:
                 self.show_error(f"Player '{reference_player}' not found.")
@@ -305,38 +397,29 @@ class MainController(QMainWindow):
     @Slot()
     def show_settings(self):
         """Show the settings dialog."""
-        settings_dialog = SettingsDialog(self)
-        settings_dialog.settings_changed.connect(self.on_settings_changed)
-        settings_dialog.exec()
+        self.settings_dialog.exec()
     
     @Slot(dict)
-    def on_settings_changed(self, config):
+    def on_settings_changed(self, changes):
         """
         Handle settings changes.
         
         Args:
-            config (dict): New configuration settings
+            changes (dict): Changed configuration settings only
         """
-        # Recreate the API client with new settings
-        old_client = self.api_client
-        self.api_client = ApiClient()
+        config = {**self._last_config, **changes}
         
-        # Disconnect old signals and connect new ones
-        old_client.data_fetched.disconnect(self.on_data_fetched)
-        old_client.error_occurred.disconnect(self.show_error)
-        old_client.request_started.disconnect(self.on_request_started)
-        old_client.request_finished.disconnect(self.on_request_finished)
+        # Apply the new settings to the existing API client if its endpoint changed
+        if any(key in changes for key in API_CONFIG_KEYS):
+            self.api_client.reconfigure(config)
         
-        self.api_client.data_fetched.connect(self.on_data_fetched)
-        self.api_client.error_occurred.connect(self.show_error)
-        self.api_client.request_started.connect(self.on_request_started)
-        self.api_client.request_finished.connect(self.on_request_finished)
+        # Reload data only if a setting that affects the fetched data changed
+        if any(key in changes for key in DATA_CONFIG_KEYS):
+            if self._dashboard_controller is not None:
+                self._dashboard_controller.invalidate_metrics_cache()
+            self.load_initial_data()
         
-        # Update the dashboard controller with the new API client
-        self.dashboard_controller.api_client = self.api_client
-        
-        # Reload data with new settings
-        self.load_initial_data()
+        self._last_config = config
         
         # Show confirmation
         self.ui.label_status.setText("Settings updated")
@@ -14,6 +14,7 @@ from PySide6.QtCore import QObject, Signal, Slot, Qt
 from PySide6.QtUiTools import QUiLoader
 
 from views.player_view import PlayerView
+from views.table_models import DataFrameModel
 
 
 class RecommendationPanel(QDialog):
@@ -63,30 +64,15 @@ class RecommendationPanel(QDialog):
         else:
             self.ui.label_subtitle.setText(f"Based on your criteria")
         
-        # Set up table model
-        from PySide6.QtGui import QStandardItemModel, QStandardItem
-        model = QStandardItemModel()
-        
-        # Set up headers
-        headers = ['Name', 'Team', 'Position', 'Age', 'Rating', 'Similarity']
-        model.setHorizontalHeaderLabels(headers)
-        
-        # Add recommendation data
-        for _, player in self.recommendations.iterrows():
-            row = []
-            for col in ['name', 'team_name', 'position', 'age', 'rating']:
-                value = player.get(col, '')
-                item = QStandardItem(str(value))
-                row.append(item)
-            
-            # Add similarity score if available
-            if 'similarity_score' in player:
-                similarity = f"{player['similarity_score'] * 100:.1f}%"
-            else:
-                similarity = "N/A"
-            row.append(QStandardItem(similarity))
-            
-            model.appendRow(row)
+        # Set up table model (reads cells straight from the DataFrame on demand)
+        model = DataFrameModel(
+            self.recommendations,
+            columns=['name', 'team_name', 'position', 'age', 'rating', 'similarity_score'],
+            headers=['Name', 'Team', 'Position', 'Age', 'Rating', 'Similarity'],
+            formatters={'similarity_score': lambda score: f"{score * 100:.1f}%"},
+            defaults={'similarity_score': "N/A"},
+            parent=self
+        )
         
         # Set the model to the table view
         self.ui.tableView_recommendations.setModel(model)
@@ -156,13 +142,13 @@ class PlayerController(QObject):
         # Keep reference to open dialogs to prevent garbage collection
         self.open_dialogs = []
     
-    @Slot(dict)
+    @Slot(object)
     def show_player_profile(self, player_data):
         """
         Show a player profile dialog.
         
         Args:
-            player_data (dict): Player data dictionary
+            player_data (dict or pd.Series): Player data mapping
         """
         # Create player view
         player_view = PlayerView(player_data)
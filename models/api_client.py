@@ -13,13 +13,55 @@ import json
 import time
 from datetime import datetime, timedelta
 import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 
+import numpy as np
 import requests
 import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PySide6.QtCore import QObject, Signal, Slot, QThreadPool
 
 from utils.config import API_KEY, API_SOURCE, CACHE_DIR
 
+# Use orjson for decoding API responses when available, stdlib json otherwise
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Seconds to wait for the API before giving up on a request
+REQUEST_TIMEOUT = 10
+
+# Number of recently decoded payloads kept for reuse on unchanged revalidations
+ETAG_STORE_SIZE = 32
+
+
+def endpoint_settings(api_source, api_key):
+    """
+    Get the API base URL and authentication headers for an API source.
+    
+    Args:
+        api_source (str): API source ('rapidapi' or 'apisports')
+        api_key (str): API key for the selected source
+    
+    Returns:
+        tuple: (base URL, headers dict)
+    """
+    if api_source == 'rapidapi':
+        return "https://api-football-v1.p.rapidapi.com/v3", {
+            'x-rapidapi-key': api_key,
+            'x-rapidapi-host': 'api-football-v1.p.rapidapi.com'
+        }
+    
+    # Default to API-Sports
+    return "https://v3.football.api-sports.io", {
+        'x-apisports-key': api_key
+    }
+
 
 class ApiClient(QObject):
     """
@@ -46,28 +88,97 @@ class ApiClient(QObject):
         os.makedirs(CACHE_DIR, exist_ok=True)
         self.cache_file = os.path.join(CACHE_DIR, 'football_api_cache')
         
-        # Configure requests-cache
+        # Configure requests-cache (WAL journal with synchronous=NORMAL, wait on locks)
         requests_cache.install_cache(
             self.cache_file,
             backend='sqlite',
-            expire_after=timedelta(hours=24)
+            expire_after=timedelta(hours=24),
+            wal=True,
+            busy_timeout=5000
+        )
+        
+        # Shared session (cached, since it is created after install_cache) with a pooled,
+        # retrying adapter so connections and TLS sessions are reused across calls.
+        # fetch_data runs on the GUI thread, so retries ignore Retry-After (which can ask
+        # for long waits) and only use the short exponential backoff, about 2 s in total.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=False
+            )
         )
+        self.session.mount('https://', adapter)
         
         # Set up API base URL and headers based on API source
-        if API_SOURCE == 'rapidapi':
-            self.api_base_url = "https://api-football-v1.p.rapidapi.com/v3"
-            self.headers = {
-                'x-rapidapi-key': API_KEY,
-                'x-rapidapi-host': 'api-football-v1.p.rapidapi.com'
-            }
-        else:  # Default to API-Sports
-            self.api_base_url = "https://v3.football.api-sports.io"
-            self.headers = {
-                'x-apisports-key': API_KEY
-            }
+        self.configure_endpoint(API_SOURCE, API_KEY)
         
         # Initialize thread pool for async requests
         self.thread_pool = QThreadPool()
+        
+        # Recently decoded payloads by request (least recently used first), kept with
+        # their ETag/Last-Modified validator; the full responses live in requests-cache
+        self._etag_store = OrderedDict()
+        self._etag_lock = threading.Lock()
+        
+        # Requests currently on the network, so identical concurrent calls share one
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+    
+    def configure_endpoint(self, api_source, api_key):
+        """
+        Set the API base URL and authentication headers.
+        
+        Args:
+            api_source (str): API source ('rapidapi' or 'apisports')
+            api_key (str): API key for the selected source
+        """
+        self.api_base_url, self.headers = endpoint_settings(api_source, api_key)
+        
+        # Replace the previous source's credentials on the session
+        for header in ('x-rapidapi-key', 'x-rapidapi-host', 'x-apisports-key'):
+            self.session.headers.pop(header, None)
+        self.session.headers.update(self.headers)
+    
+    def validate_key(self, api_source, api_key):
+        """
+        Check an API key against the API's status endpoint. Safe to call from a worker thread.
+        
+        Args:
+            api_source (str): API source ('rapidapi' or 'apisports')
+            api_key (str): API key to check
+        
+        Returns:
+            bool: Whether the API accepted the key
+        """
+        base_url, headers = endpoint_settings(api_source, api_key)
+        response = self.session.get(
+            f"{base_url}/status",
+            headers=headers,
+            timeout=REQUEST_TIMEOUT,
+            expire_after=requests_cache.DO_NOT_CACHE
+        )
+        if response.status_code in (401, 403):
+            return False
+        response.raise_for_status()
+        
+        # API-Football reports a rejected key in 'errors' with a 200 status
+        return not json_loads(response.content).get('errors')
+    
+    def reconfigure(self, config):
+        """
+        Apply new settings to the existing client in place.
+        
+        Args:
+            config (dict): Configuration settings
+        """
+        api_source = config.get('api_source', API_SOURCE)
+        self.use_mock_data = api_source == 'mock'
+        self.configure_endpoint(api_source, config.get('api_key', API_KEY))
     
     @Slot(str, dict)
     def fetch_data(self, endpoint, params=None):
@@ -86,19 +197,88 @@ class ApiClient(QObject):
             return
         
         try:
-            url = f"{self.api_base_url}{endpoint}"
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self.request_json(endpoint, params)
             self.data_fetched.emit(data)
             
         except requests.RequestException as e:
             self.error_occurred.emit(f"API request failed: {str(e)}")
         
+        except ValueError as e:
+            self.error_occurred.emit(f"Invalid API response: {str(e)}")
+        
         finally:
             self.request_finished.emit()
     
+    def request_json(self, endpoint, params=None):
+        """
+        Perform a GET request on the shared session and decode the JSON body.
+        
+        Args:
+            endpoint (str): API endpoint (e.g., '/players')
+            params (dict, optional): Query parameters. Defaults to None.
+        
+        Returns:
+            dict: Decoded API response
+        """
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        
+        # Join an identical request that is already in flight instead of sending another
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = Future()
+        
+        if not is_owner:
+            return future.result()
+        
+        try:
+            data = self.send_request(endpoint, params, key)
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    def send_request(self, endpoint, params, key):
+        """
+        Send a GET request and decode the JSON body.
+        
+        Args:
+            endpoint (str): API endpoint (e.g., '/players')
+            params (dict): Query parameters, or None
+            key (tuple): Request key for the validator store
+        
+        Returns:
+            dict: Decoded API response
+        """
+        url = f"{self.api_base_url}{endpoint}"
+        response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        
+        # The cache revalidates stale entries with If-None-Match/If-Modified-Since;
+        # when the validator is unchanged, reuse the payload decoded last time
+        validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+        if validator:
+            with self._etag_lock:
+                stored = self._etag_store.get(key)
+                if stored and stored[0] == validator:
+                    self._etag_store.move_to_end(key)
+                    return stored[1]
+        
+        data = json_loads(response.content)
+        if validator:
+            with self._etag_lock:
+                self._etag_store[key] = (validator, data)
+                self._etag_store.move_to_end(key)
+                if len(self._etag_store) > ETAG_STORE_SIZE:
+                    self._etag_store.popitem(last=False)
+        
+        return data
+    
     def mock_data_response(self, endpoint, params=None):
         """
         Generate mock data for API endpoints.
@@ -133,6 +313,20 @@ class ApiClient(QObject):
         Returns:
             dict: Mock API response with top players data
         """
+        return {"response": self.build_mock_players(range(10000, 10020))}
+    
+    def build_mock_players(self, player_ids):
+        """
+        Build mock player records, one per player ID.
+        
+        Args:
+            player_ids (iterable): Player IDs to generate records for
+        
+        Returns:
+            list: Mock player records in the API response format
+        """
+        player_ids = list(player_ids)
+        
         # Names for mock players
         first_names = ["Lionel", "Cristiano", "Robert", "Kevin", "Mohamed", "Virgil", "Sergio", "Harry", "Kylian", "Neymar"]
         last_names = ["Messi", "Ronaldo", "Lewandowski", "De Bruyne", "Salah", "van Dijk", "Ramos", "Kane", "Mbappé", "Jr"]
@@ -141,51 +335,61 @@ class ApiClient(QObject):
         teams = ["Manchester United", "Barcelona", "Real Madrid", "Bayern Munich", "Liverpool", "Paris Saint-Germain", 
                  "Manchester City", "Chelsea", "Juventus", "Borussia Dortmund"]
         
-        # Player positions
+        # Player positions with per-position (low, high) bounds for
+        # goals, assists, passes accuracy and tackles
         positions = ["Forward", "Midfielder", "Defender", "Goalkeeper"]
         position_weights = [0.4, 0.3, 0.2, 0.1]  # Probability weights
+        stat_bounds = np.array([
+            [(10, 30), (2, 15), (70, 85), (5, 20)],     # Forward
+            [(3, 12), (5, 20), (80, 92), (30, 70)],     # Midfielder
+            [(1, 5), (1, 8), (75, 90), (50, 120)],      # Defender
+            [(0, 0), (0, 2), (70, 85), (0, 5)]          # Goalkeeper
+        ])
+        
+        # Draw every random value for all players at once
+        n_players = len(player_ids)
+        rng = np.random.default_rng()
+        
+        def draw(low, high):
+            return rng.integers(low, high + 1, size=n_players).tolist()
         
-        # Generate players
+        position_idx = rng.choice(len(positions), size=n_players, p=position_weights)
+        bounds = stat_bounds[position_idx]
+        goals, assists, passes_accuracy, tackles = (
+            rng.integers(bounds[:, k, 0], bounds[:, k, 1] + 1).tolist() for k in range(4)
+        )
+        names = zip(rng.choice(first_names, size=n_players).tolist(),
+                    rng.choice(last_names, size=n_players).tolist())
+        firstnames = rng.choice(first_names, size=n_players).tolist()
+        lastnames = rng.choice(last_names, size=n_players).tolist()
+        ages = draw(20, 36)
+        heights = draw(170, 195)
+        weights = draw(65, 90)
+        appearances = draw(20, 38)
+        minutes = draw(1800, 3400)
+        ratings = np.round(rng.uniform(6.5, 8.9, size=n_players), 1).tolist()
+        shots_total = draw(20, 100)
+        shots_on = draw(10, 50)
+        passes_total = draw(500, 2000)
+        blocks = draw(5, 30)
+        interceptions = draw(10, 50)
+        duels_total = draw(100, 300)
+        duels_won = draw(50, 200)
+        
+        # Assemble the player records
         players = []
-        for i in range(20):
-            # Basic player info
-            player_id = 10000 + i
-            position = random.choices(positions, weights=position_weights)[0]
-            
-            # Randomize stats based on position
-            if position == "Forward":
-                goals = random.randint(10, 30)
-                assists = random.randint(2, 15)
-                passes_accuracy = random.randint(70, 85)
-                tackles = random.randint(5, 20)
-            elif position == "Midfielder":
-                goals = random.randint(3, 12)
-                assists = random.randint(5, 20)
-                passes_accuracy = random.randint(80, 92)
-                tackles = random.randint(30, 70)
-            elif position == "Defender":
-                goals = random.randint(1, 5)
-                assists = random.randint(1, 8)
-                passes_accuracy = random.randint(75, 90)
-                tackles = random.randint(50, 120)
-            else:  # Goalkeeper
-                goals = 0
-                assists = random.randint(0, 2)
-                passes_accuracy = random.randint(70, 85)
-                tackles = random.randint(0, 5)
-            
-            # Generate player data
+        for i, (first_name, last_name) in enumerate(names):
             player = {
                 "player": {
-                    "id": player_id,
-                    "name": f"{random.choice(first_names)} {random.choice(last_names)}",
-                    "firstname": random.choice(first_names),
-                    "lastname": random.choice(last_names),
-                    "age": random.randint(20, 36),
+                    "id": player_ids[i],
+                    "name": f"{first_name} {last_name}",
+                    "firstname": firstnames[i],
+                    "lastname": lastnames[i],
+                    "age": ages[i],
                     "nationality": "Country",
-                    "height": f"{random.randint(170, 195)} cm",
-                    "weight": f"{random.randint(65, 90)} kg",
-                    "position": position
+                    "height": f"{heights[i]} cm",
+                    "weight": f"{weights[i]} kg",
+                    "position": positions[position_idx[i]]
                 },
                 "statistics": [{
                     "team": {
@@ -198,36 +402,36 @@ class ApiClient(QObject):
                         "country": "England"
                     },
                     "games": {
-                        "appearances": random.randint(20, 38),
-                        "minutes": random.randint(1800, 3400),
-                        "rating": round(random.uniform(6.5, 8.9), 1)
+                        "appearances": appearances[i],
+                        "minutes": minutes[i],
+                        "rating": ratings[i]
                     },
                     "shots": {
-                        "total": random.randint(20, 100),
-                        "on": random.randint(10, 50)
+                        "total": shots_total[i],
+                        "on": shots_on[i]
                     },
                     "goals": {
-                        "total": goals,
-                        "assists": assists
+                        "total": goals[i],
+                        "assists": assists[i]
                     },
                     "passes": {
-                        "total": random.randint(500, 2000),
-                        "accuracy": passes_accuracy
+                        "total": passes_total[i],
+                        "accuracy": passes_accuracy[i]
                     },
                     "tackles": {
-                        "total": tackles,
-                        "blocks": random.randint(5, 30),
-                        "interceptions": random.randint(10, 50)
+                        "total": tackles[i],
+                        "blocks": blocks[i],
+                        "interceptions": interceptions[i]
                     },
                     "duels": {
-                        "total": random.randint(100, 300),
-                        "won": random.randint(50, 200)
+                        "total": duels_total[i],
+                        "won": duels_won[i]
                     }
                 }]
             }
             players.append(player)
         
-        return {"response": players}
+        return players
     
     def generate_mock_player_details(self, player_id):
         """
@@ -239,18 +443,9 @@ class ApiClient(QObject):
         Returns:
             dict: Mock API response with player details
         """
-        # Just return the same format as top players but with only one player
-        top_players = self.generate_mock_top_players()
-        
-        # If we have a specific player ID, try to find it
-        if player_id is not None and top_players["response"]:
-            # Just use the first player but change its ID
-            player = top_players["response"][0]
-            player["player"]["id"] = int(player_id)
-            return {"response": [player]}
-        
-        # Otherwise just return the first player
-        return {"response": [top_players["response"][0]]} if top_players["response"] else {"response": []}
+        # Same format as top players but with only the requested player
+        player_id = int(player_id) if player_id is not None else 10000
+        return {"response": self.build_mock_players([player_id])}
     
     def generate_mock_player_statistics(self, player_id):
         """
@@ -334,4 +529,6 @@ class ApiClient(QObject):
     
     def clear_cache(self):
         """Clear the API request cache."""
-        requests_cache.clear()
\ No newline at end of file
+        requests_cache.clear()
+        with self._etag_lock:
+            self._etag_store.clear()
\ No newline at end of file
@@ -8,11 +8,52 @@ This module handles data processing, transformation and normalization
 of football data for visualization and analysis.
 """
 
+from collections import defaultdict
+
 import pandas as pd
 import numpy as np
 from PySide6.QtCore import QObject, Signal, Slot
 
 
+# Player fields attached to every flattened statistics record
+PLAYER_META_FIELDS = (
+    'id', 'name', 'firstname', 'lastname', 'age',
+    'nationality', 'height', 'weight', 'position'
+)
+
+# Flattened API field names mapped to processed column names
+COLUMN_MAPPING = {
+    'player_name': 'name',
+    'player_firstname': 'firstname',
+    'player_lastname': 'lastname',
+    'player_age': 'age',
+    'player_nationality': 'nationality',
+    'player_height': 'height',
+    'player_weight': 'weight',
+    'player_position': 'position',
+    'games_appearances': 'appearances',
+    'games_minutes': 'minutes_played',
+    'games_rating': 'rating',
+    'shots_on': 'shots_on_target',
+    'goals_assists': 'assists'
+}
+
+
+def index_first_rows(values):
+    """
+    Map each distinct value to the position of its first row.
+    
+    Args:
+        values (array-like): Column values (e.g., player IDs)
+    
+    Returns:
+        dict: Mapping of value to row position
+    """
+    values = np.asarray(values)
+    unique_values, first_rows = np.unique(values, return_index=True)
+    return dict(zip(unique_values.tolist(), first_rows.tolist()))
+
+
 class DataProcessor(QObject):
     """
     Process and transform football data for analysis.
@@ -25,11 +66,68 @@ class DataProcessor(QObject):
     processing_complete = Signal(object)
     processing_error = Signal(str)
     
-    def __init__(self, parent=None):
-        """Initialize the data processor."""
+    # Columns used by the dashboard, player profile and recommender
+    REQUIRED_COLUMNS = (
+        'player_id', 'name', 'age', 'nationality', 'height', 'weight',
+        'position', 'team_name', 'appearances', 'minutes_played', 'rating',
+        'shots_total', 'shots_on_target', 'goals_total', 'assists',
+        'passes_total', 'passes_accuracy', 'tackles_total', 'tackles_blocks',
+        'tackles_interceptions', 'duels_total', 'duels_won'
+    )
+    
+    # Smallest dtype family for each numeric column, applied at ingest. Ratings stay
+    # float64 (None): float32 values such as 7.3 show as 7.300000190734863 once displayed
+    NUMERIC_DTYPES = {
+        'player_id': 'integer',
+        'team_id': 'integer',
+        'league_id': 'integer',
+        'age': 'integer',
+        'appearances': 'integer',
+        'minutes_played': 'integer',
+        'rating': None,
+        'shots_total': 'integer',
+        'shots_on_target': 'integer',
+        'goals_total': 'integer',
+        'assists': 'integer',
+        'passes_total': 'integer',
+        'passes_accuracy': 'integer',
+        'tackles_total': 'integer',
+        'tackles_blocks': 'integer',
+        'tackles_interceptions': 'integer',
+        'duels_total': 'integer',
+        'duels_won': 'integer'
+    }
+    
+    # Text columns, filled with '' when missing
+    STRING_COLUMNS = (
+        'name', 'firstname', 'lastname', 'nationality', 'height', 'weight',
+        'position', 'team_name', 'league_name'
+    )
+    
+    # Fill value for each schema column when missing
+    FILL_VALUES = {**dict.fromkeys(NUMERIC_DTYPES, 0), **dict.fromkeys(STRING_COLUMNS, '')}
+    
+    # Low-cardinality text columns used for grouping and filtering
+    CATEGORY_COLUMNS = ('position', 'team_name', 'nationality')
+    
+    def __init__(self, parent=None, extra_columns=None):
+        """
+        Initialize the data processor.
+        
+        Args:
+            parent (QObject, optional): Parent object. Defaults to None.
+            extra_columns (iterable, optional): Additional columns to keep in players_df
+                (e.g., 'firstname', 'league_id'). Defaults to None.
+        """
         super().__init__(parent)
+        self.columns = list(self.REQUIRED_COLUMNS) + [
+            col for col in (extra_columns or []) if col not in self.REQUIRED_COLUMNS
+        ]
         self.players_df = None
         self.teams_df = None
+        self._player_rows = {}
+        self._names_lower = []
+        self._name_index = {}
     
     @Slot(dict)
     def process_players_data(self, data):
@@ -47,82 +145,92 @@ class DataProcessor(QObject):
                 self.processing_error.emit("No player data found in the API response")
                 return
             
-            # Create a structured DataFrame
-            processed_data = []
-            
-            for player in players:
-                player_info = player.get('player', {})
-                stats = player.get('statistics', [])
-                
-                for stat in stats:
-                    team = stat.get('team', {})
-                    league = stat.get('league', {})
-                    games = stat.get('games', {})
-                    shots = stat.get('shots', {})
-                    goals = stat.get('goals', {})
-                    passes = stat.get('passes', {})
-                    tackles = stat.get('tackles', {})
-                    duels = stat.get('duels', {})
-                    
-                    processed_data.append({
-                        'player_id': player_info.get('id'),
-                        'name': player_info.get('name'),
-                        'firstname': player_info.get('firstname'),
-                        'lastname': player_info.get('lastname'),
-                        'age': player_info.get('age'),
-                        'nationality': player_info.get('nationality'),
-                        'height': player_info.get('height'),
-                        'weight': player_info.get('weight'),
-                        'position': player_info.get('position'),
-                        'team_id': team.get('id'),
-                        'team_name': team.get('name'),
-                        'league_id': league.get('id'),
-                        'league_name': league.get('name'),
-                        'appearances': games.get('appearances'),
-                        'minutes_played': games.get('minutes'),
-                        'rating': games.get('rating'),
-                        'shots_total': shots.get('total'),
-                        'shots_on_target': shots.get('on'),
-                        'goals_total': goals.get('total'),
-                        'assists': goals.get('assists'),
-                        'passes_total': passes.get('total'),
-                        'passes_accuracy': passes.get('accuracy'),
-                        'tackles_total': tackles.get('total'),
-                        'tackles_blocks': tackles.get('blocks'),
-                        'tackles_interceptions': tackles.get('interceptions'),
-                        'duels_total': duels.get('total'),
-                        'duels_won': duels.get('won')
-                    })
-            
-            # Create DataFrame
-            self.players_df = pd.DataFrame(processed_data)
+            # Flatten statistics records with player info attached as metadata
+            players = [player for player in players if player.get('statistics')]
+            flat_df = pd.json_normalize(
+                players,
+                record_path=['statistics'],
+                meta=[['player', field] for field in PLAYER_META_FIELDS],
+                sep='_',
+                errors='ignore'
+            )
+            
+            # Rename to the processed column names and keep only the projected columns
+            flat_df = flat_df.rename(columns=COLUMN_MAPPING)
+            self.players_df = flat_df.reindex(columns=self.columns)
+            
+            # Downcast numeric columns to the smallest fitting dtype
+            self.players_df = self.downcast_numeric_columns(self.players_df)
             
             # Handle missing values
             self.players_df = self.handle_missing_values(self.players_df)
             
+            # Low-cardinality columns used for grouping and filtering
+            self.players_df = self.players_df.astype(
+                {col: 'category' for col in self.CATEGORY_COLUMNS if col in self.players_df.columns}
+            )
+            
+            # Lowercased names for case-insensitive substring search
+            self.players_df['_name_lower'] = self.players_df['name'].str.lower()
+            
+            # Row positions by player ID for constant-time lookups
+            self._player_rows = index_first_rows(self.players_df['player_id'])
+            
+            # Trigram index over lowercased names for substring search
+            self.build_name_index()
+            
             # Emit processed data
             self.processing_complete.emit(self.players_df)
             
         except Exception as e:
             self.processing_error.emit(f"Error processing player data: {str(e)}")
     
-    def handle_missing_values(self, df):
+    def downcast_numeric_columns(self, df):
+        """
+        Convert numeric columns to compact dtypes (e.g., int16 goals).
+        
+        Args:
+            df (pd.DataFrame): DataFrame with raw column values
+        
+        Returns:
+            pd.DataFrame: DataFrame with downcast numeric columns
+        """
+        for col, downcast in self.NUMERIC_DTYPES.items():
+            if col in df.columns:
+                values = pd.to_numeric(df[col], errors='coerce').fillna(0)
+                df[col] = pd.to_numeric(values, downcast=downcast)
+        
+        return df
+    
+    def handle_missing_values(self, df, numeric_cols=None, string_cols=None):
         """
         Handle missing values in the DataFrame.
         
         Args:
             df (pd.DataFrame): DataFrame with possibly missing values
+            numeric_cols (iterable, optional): Columns to fill with 0.
+                Defaults to the schema's numeric columns.
+            string_cols (iterable, optional): Columns to fill with ''.
+                Defaults to the schema's string columns.
         
         Returns:
             pd.DataFrame: DataFrame with handled missing values
         """
-        # Fill numeric columns with 0
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        df[numeric_cols] = df[numeric_cols].fillna(0)
+        # Numeric columns are filled with 0, string columns with an empty string
+        if numeric_cols is None and string_cols is None:
+            fill_values = self.FILL_VALUES
+        else:
+            fill_values = {
+                **dict.fromkeys(self.NUMERIC_DTYPES if numeric_cols is None else numeric_cols, 0),
+                **dict.fromkeys(self.STRING_COLUMNS if string_cols is None else string_cols, '')
+            }
+        fill_values = {col: value for col, value in fill_values.items() if col in df.columns}
         
-        # Fill string columns with empty string
-        string_cols = df.select_dtypes(include=['object']).columns
-        df[string_cols] = df[string_cols].fillna('')
+        # Nothing to fill on the common fully-populated path
+        if not any(df[col].hasnans for col in fill_values):
+            return df
+        
+        df.fillna(value=fill_values, inplace=True)
         
         return df
     
@@ -145,29 +253,23 @@ class DataProcessor(QObject):
         
         # Calculate additional metrics
         try:
+            # Divisors of 0 are masked to NaN so each ratio comes out NaN
+            # instead of inf and is filled with 0 in the same expression
+            
             # Calculate minutes per appearance
-            df['minutes_per_appearance'] = df['minutes_played'] / df['appearances']
+            appearances = df['appearances'].where(df['appearances'] > 0)
+            df['minutes_per_appearance'] = df['minutes_played'].div(appearances).fillna(0)
             
             # Calculate pass completion rate
             df['pass_completion_rate'] = df['passes_accuracy']
             
             # Calculate shot conversion rate
-            df['shot_conversion_rate'] = np.where(
-                df['shots_total'] > 0,
-                df['goals_total'] / df['shots_total'] * 100,
-                0
-            )
+            shots = df['shots_total'].where(df['shots_total'] > 0)
+            df['shot_conversion_rate'] = df['goals_total'].div(shots).mul(100).fillna(0)
             
             # Calculate duels success rate
-            df['duels_success_rate'] = np.where(
-                df['duels_total'] > 0,
-                df['duels_won'] / df['duels_total'] * 100,
-                0
-            )
-            
-            # Clean up infinite values
-            df.replace([np.inf, -np.inf], np.nan, inplace=True)
-            df = self.handle_missing_values(df)
+            duels = df['duels_total'].where(df['duels_total'] > 0)
+            df['duels_success_rate'] = df['duels_won'].div(duels).mul(100).fillna(0)
             
             return df
             
@@ -188,12 +290,52 @@ class DataProcessor(QObject):
         if self.players_df is None:
             return None
         
-        player = self.players_df[self.players_df['player_id'] == player_id]
+        row = self._player_rows.get(player_id)
         
-        if len(player) == 0:
+        if row is None:
             return None
         
-        return player.iloc[0]
+        return self.players_df.iloc[row]
+    
+    def build_name_index(self):
+        """Build a trigram -> row positions index over the lowercased player names."""
+        self._names_lower = self.players_df['_name_lower'].tolist()
+        
+        name_index = defaultdict(set)
+        for row, name in enumerate(self._names_lower):
+            for k in range(len(name) - 2):
+                name_index[name[k:k + 3]].add(row)
+        
+        self._name_index = dict(name_index)
+    
+    def find_player_rows(self, query):
+        """
+        Find players whose name contains the query (case-insensitive).
+        
+        Args:
+            query (str): Name or part of a name
+        
+        Returns:
+            list: Row positions of matching players, in DataFrame order
+        """
+        if self.players_df is None:
+            return []
+        
+        needle = query.lower()
+        
+        if len(needle) < 3:
+            # Too short for trigrams, check every name
+            candidates = range(len(self._names_lower))
+        else:
+            # Rows containing every trigram of the query, smallest set first
+            trigram_rows = sorted(
+                (self._name_index.get(needle[k:k + 3], set()) for k in range(len(needle) - 2)),
+                key=len
+            )
+            candidates = set.intersection(*trigram_rows)
+        
+        # Drop trigram false positives
+        return sorted(row for row in candidates if needle in self._names_lower[row])
     
     def get_players_by_position(self, position):
         """
@@ -13,9 +13,103 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.neighbors import NearestNeighbors
 from sklearn.pipeline import Pipeline
 from sklearn.impute import SimpleImputer
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
 
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, Signal, Slot, QThreadPool
+
+from models.data_processor import index_first_rows
+from utils.workers import Worker
+
+# numba is optional; without it the bounds filter runs as a vectorized numpy scan
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Row count from which the compiled bounds filter is used; smaller matrices are
+# faster with numpy than with the kernel's thread start-up (and first-call compile)
+NUMBA_MIN_ROWS = 10000
+
+
+def _filter_rows_numpy(X, min_arr, max_arr):
+    """
+    Flag the rows whose values all fall within per-column bounds, using numpy.
+    
+    Args:
+        X (np.ndarray): Feature matrix (rows x columns)
+        min_arr (np.ndarray): Lower bound per column, NaN when unconstrained
+        max_arr (np.ndarray): Upper bound per column, NaN when unconstrained
+    
+    Returns:
+        np.ndarray: Boolean mask of matching rows
+    """
+    # Comparisons with NaN are False, so unconstrained columns never reject a row
+    return ~((X < min_arr) | (X > max_arr)).any(axis=1)
+
+
+_filter_rows_kernel = None
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _filter_rows_kernel(X, min_arr, max_arr):
+        """Compiled equivalent of _filter_rows_numpy, stopping at the first failed bound."""
+        out_mask = np.empty(X.shape[0], dtype=np.bool_)
+        for i in prange(X.shape[0]):
+            ok = True
+            for j in range(X.shape[1]):
+                v = X[i, j]
+                if v < min_arr[j] or v > max_arr[j]:
+                    ok = False
+                    break
+            out_mask[i] = ok
+        return out_mask
+
+
+def filter_rows_in_bounds(X, min_arr, max_arr):
+    """
+    Flag the rows whose values all fall within per-column bounds.
+    
+    The compiled kernel is only used for at least NUMBA_MIN_ROWS rows.
+    
+    Args:
+        X (np.ndarray): Feature matrix (rows x columns)
+        min_arr (np.ndarray): Lower bound per column, NaN when unconstrained
+        max_arr (np.ndarray): Upper bound per column, NaN when unconstrained
+    
+    Returns:
+        np.ndarray: Boolean mask of matching rows
+    """
+    if _filter_rows_kernel is not None and X.shape[0] >= NUMBA_MIN_ROWS:
+        return _filter_rows_kernel(X, min_arr, max_arr)
+    return _filter_rows_numpy(X, min_arr, max_arr)
+
+
+def fit_preprocessing(X, columns, cache):
+    """
+    Fit the imputer and scaler on a feature matrix, reusing a cached result for the same data.
+    
+    Args:
+        X (np.ndarray): Raw float32 feature matrix
+        columns (list): Feature column names
+        cache (tuple): Last result as (fingerprint, X_processed, columns, fitted pipeline)
+    
+    Returns:
+        tuple: (X_processed, fitted pipeline, cache entry for this result)
+    """
+    # Reuse the last result if the same columns hold the same feature values
+    fingerprint = (tuple(columns), X.shape, hash(X.tobytes()))
+    if fingerprint == cache[0]:
+        return cache[1], cache[3], cache
+    
+    # Create preprocessing pipeline (float32 is preserved by the imputer and scaler)
+    preprocessing = Pipeline([
+        ('imputer', SimpleImputer(strategy='mean')),
+        ('scaler', StandardScaler())
+    ])
+    
+    # Fit and transform
+    X_processed = preprocessing.fit_transform(X)
+    
+    return X_processed, preprocessing, (fingerprint, X_processed, columns, preprocessing)
 
 
 class PlayerRecommender(QObject):
@@ -31,6 +125,15 @@ class PlayerRecommender(QObject):
     recommendation_ready = Signal(object)
     error_occurred = Signal(str)
     
+    # Features used for player similarity
+    FEATURE_COLUMNS = (
+        'age', 'minutes_played', 'rating',
+        'shots_total', 'shots_on_target', 'goals_total', 'assists',
+        'passes_total', 'passes_accuracy', 'tackles_total',
+        'tackles_blocks', 'tackles_interceptions',
+        'duels_total', 'duels_won'
+    )
+    
     def __init__(self, parent=None):
         """Initialize the player recommender."""
         super().__init__(parent)
@@ -41,6 +144,26 @@ class PlayerRecommender(QObject):
         self.feature_columns = None
         self.scaler = None
         self.players_df = None
+        self._player_rows = {}
+        self._raw_features = []
+        self._X_raw = None
+        
+        # State from the last training run, reused by recommendations
+        self._preprocessor = None
+        self._features = None
+        self._X = None
+        self._trained_df = None
+        self._train_X = None
+        self._cluster_members = {}
+        
+        # Last preprocessing result as (fingerprint, X_processed, columns, fitted pipeline)
+        self._preproc_cache = (None, None, None, None)
+        
+        # Background training state: one run at a time, with at most one queued rerun
+        # and the similar-player request waiting for the models
+        self._training = False
+        self._retrain_pending = False
+        self._pending_recommendation = None
     
     @Slot(object)
     def set_data(self, players_df):
@@ -51,6 +174,22 @@ class PlayerRecommender(QObject):
             players_df (pd.DataFrame): DataFrame with player data
         """
         self.players_df = players_df
+        
+        # Feature matrix from the last training run no longer matches the data
+        self._X = None
+        
+        if players_df is None:
+            self._player_rows = {}
+            self._raw_features = []
+            self._X_raw = None
+            return
+        
+        # Row positions by player ID for constant-time lookups
+        self._player_rows = index_first_rows(players_df['player_id'])
+        
+        # Raw features as one contiguous float32 matrix, built once per dataset
+        self._raw_features = [col for col in self.FEATURE_COLUMNS if col in players_df.columns]
+        self._X_raw = np.ascontiguousarray(players_df[self._raw_features].to_numpy(dtype=np.float32))
     
     def preprocess_data(self, df=None):
         """
@@ -71,13 +210,7 @@ class PlayerRecommender(QObject):
         
         try:
             # Select relevant features for player similarity
-            self.feature_columns = [
-                'age', 'minutes_played', 'rating',
-                'shots_total', 'shots_on_target', 'goals_total', 'assists',
-                'passes_total', 'passes_accuracy', 'tackles_total',
-                'tackles_blocks', 'tackles_interceptions',
-                'duels_total', 'duels_won'
-            ]
+            self.feature_columns = list(self.FEATURE_COLUMNS)
             
             # Ensure all needed columns exist
             existing_columns = [col for col in self.feature_columns if col in df.columns]
@@ -86,19 +219,18 @@ class PlayerRecommender(QObject):
                 self.error_occurred.emit("Insufficient features for recommendation")
                 return None, None
             
-            # Create feature matrix
-            X = df[existing_columns].copy()
-            
-            # Create preprocessing pipeline
-            preprocessing = Pipeline([
-                ('imputer', SimpleImputer(strategy='mean')),
-                ('scaler', StandardScaler())
-            ])
+            # Create feature matrix, reusing the one built in set_data for the current data
+            if df is self.players_df and self._X_raw is not None:
+                X = self._X_raw
+            else:
+                X = np.ascontiguousarray(df[existing_columns].to_numpy(dtype=np.float32))
             
-            # Fit and transform
-            X_processed = preprocessing.fit_transform(X)
+            X_processed, preprocessing, self._preproc_cache = fit_preprocessing(
+                X, existing_columns, self._preproc_cache
+            )
             
-            # Store the scaler for later use
+            # Store the fitted pipeline and scaler for later use
+            self._preprocessor = preprocessing
             self.scaler = preprocessing.named_steps['scaler']
             
             return X_processed, existing_columns
@@ -107,40 +239,191 @@ class PlayerRecommender(QObject):
             self.error_occurred.emit(f"Error preprocessing data: {str(e)}")
             return None, None
     
+    def training_snapshot(self):
+        """
+        Capture the inputs of a training run, so it stays consistent if the data is replaced.
+        
+        Returns:
+            tuple: Arguments for fit_models, or None if there is no data
+        """
+        if self.players_df is None or len(self.players_df) == 0 or self._X_raw is None:
+            return None
+        
+        return (
+            self.players_df,
+            self._X_raw,
+            list(self._raw_features),
+            self._preproc_cache,
+            self.kmeans_model
+        )
+    
+    @staticmethod
+    def fit_models(players_df, X_raw, features, preproc_cache, previous_kmeans):
+        """
+        Fit the preprocessing and recommendation models into new objects. Safe to run on a
+        worker thread: nothing on the recommender is read or modified.
+        
+        Args:
+            players_df (pd.DataFrame): Player data the features belong to
+            X_raw (np.ndarray): Raw float32 feature matrix of players_df
+            features (list): Feature column names
+            preproc_cache (tuple): Last preprocessing result, see fit_preprocessing
+            previous_kmeans (MiniBatchKMeans): Previous clustering model, or None
+        
+        Returns:
+            dict: Trained models and the data they were trained on
+        """
+        if len(features) < 5:  # Arbitrary threshold for minimum features
+            raise ValueError("Insufficient features for recommendation")
+        
+        # Preprocess data
+        X, preprocessing, preproc_cache = fit_preprocessing(X_raw, features, preproc_cache)
+        
+        # Train k-NN model (tree index built once, queries in parallel)
+        knn_model = NearestNeighbors(
+            n_neighbors=min(11, len(X)),  # Limit by dataset size
+            algorithm='ball_tree',
+            leaf_size=30,
+            metric='euclidean',
+            n_jobs=-1
+        )
+        knn_model.fit(X)
+        
+        # Train k-means model for player clustering, warm-started from the
+        # previous centers when retraining with the same cluster layout
+        n_clusters = min(8, len(X))  # Limit by dataset size
+        if previous_kmeans is not None and previous_kmeans.cluster_centers_.shape == (n_clusters, X.shape[1]):
+            init, n_init = previous_kmeans.cluster_centers_, 1
+        else:
+            init, n_init = 'k-means++', 3
+        
+        kmeans_model = MiniBatchKMeans(
+            n_clusters=n_clusters,
+            init=init,
+            n_init=n_init,
+            batch_size=min(256, len(X)),
+            random_state=42
+        )
+        cluster_labels = kmeans_model.fit_predict(X)
+        
+        return {
+            'players_df': players_df,
+            'X': X,
+            'features': features,
+            'preprocessor': preprocessing,
+            'preproc_cache': preproc_cache,
+            'knn_model': knn_model,
+            'kmeans_model': kmeans_model,
+            'cluster_labels': cluster_labels
+        }
+    
+    def apply_trained_models(self, result):
+        """
+        Publish the result of fit_models. Must run on the GUI thread.
+        
+        Args:
+            result (dict): Trained models and the data they were trained on
+        """
+        players_df = result['players_df']
+        X = result['X']
+        labels = result['cluster_labels']
+        
+        # Fitted pipeline and scaler, for transforming players of newer data
+        self.feature_columns = list(self.FEATURE_COLUMNS)
+        self._preprocessor = result['preprocessor']
+        self.scaler = self._preprocessor.named_steps['scaler']
+        self._preproc_cache = result['preproc_cache']
+        
+        # Models, with the data their indices refer to
+        self.knn_model = result['knn_model']
+        self.kmeans_model = result['kmeans_model']
+        self._features = result['features']
+        self._trained_df = players_df
+        
+        # Training rows by cluster, used to narrow similar-player searches
+        self._train_X = X
+        n_clusters = len(self.kmeans_model.cluster_centers_)
+        self._cluster_members = {c: np.flatnonzero(labels == c) for c in range(n_clusters)}
+        
+        # The feature matrix and cluster labels only match the current rows
+        # if the data was not replaced while training
+        if players_df is self.players_df:
+            self._X = X
+            players_df['cluster'] = labels
+        
+        # Signal that the model is trained
+        self.model_trained.emit()
+    
     @Slot()
     def train_models(self):
-        """Train the recommendation models."""
+        """Train the recommendation models on the calling (GUI) thread."""
+        snapshot = self.training_snapshot()
+        if snapshot is None:
+            self.error_occurred.emit("No data available for preprocessing")
+            return
+        
         try:
-            # Preprocess data
-            X, features = self.preprocess_data()
-            
-            if X is None or features is None:
-                return
-            
-            # Train k-NN model
-            self.knn_model = NearestNeighbors(
-                n_neighbors=min(11, len(X)),  # Limit by dataset size
-                algorithm='auto',
-                metric='euclidean'
-            )
-            self.knn_model.fit(X)
-            
-            # Train k-means model for player clustering
-            self.kmeans_model = KMeans(
-                n_clusters=min(8, len(X)),  # Limit by dataset size
-                random_state=42
-            )
-            cluster_labels = self.kmeans_model.fit_predict(X)
-            
-            # Add cluster labels to dataframe
-            self.players_df['cluster'] = cluster_labels
-            
-            # Signal that the model is trained
-            self.model_trained.emit()
-            
+            self.apply_trained_models(self.fit_models(*snapshot))
         except Exception as e:
             self.error_occurred.emit(f"Error training recommendation models: {str(e)}")
     
+    @Slot()
+    def start_training(self):
+        """Train the recommendation models on a worker thread; reruns once if already training."""
+        if self._training:
+            self._retrain_pending = True
+            return
+        
+        snapshot = self.training_snapshot()
+        if snapshot is None:
+            self.error_occurred.emit("No data available for preprocessing")
+            return
+        
+        self._training = True
+        worker = Worker(self.fit_models, *snapshot)
+        worker.signals.finished.connect(self.on_training_finished)
+        worker.signals.error.connect(self.on_training_error)
+        QThreadPool.globalInstance().start(worker)
+    
+    @Slot(object)
+    def on_training_finished(self, result):
+        """
+        Publish the models of a finished background training run.
+        
+        Args:
+            result (dict): Trained models and the data they were trained on
+        """
+        self._training = False
+        self.apply_trained_models(result)
+        self.continue_after_training()
+    
+    @Slot(str)
+    def on_training_error(self, message):
+        """
+        Report a failed background training run.
+        
+        Args:
+            message (str): Error message
+        """
+        self._training = False
+        self.error_occurred.emit(f"Error training recommendation models: {message}")
+        self.continue_after_training()
+    
+    def continue_after_training(self):
+        """Start the queued rerun, or answer the similar-player request that waited for training."""
+        if self._retrain_pending:
+            self._retrain_pending = False
+            self.start_training()
+            return
+        
+        if self._pending_recommendation is not None:
+            player_id, n_recommendations = self._pending_recommendation
+            self._pending_recommendation = None
+            if self.knn_model is None:
+                self.error_occurred.emit("Recommendation model not available")
+            else:
+                self.recommend_similar_players(player_id, n_recommendations)
+    
     @Slot(int, int)
     def recommend_similar_players(self, player_id, n_recommendations=5):
         """
@@ -152,6 +435,10 @@ class PlayerRecommender(QObject):
         """
         try:
             if self.knn_model is None:
+                # Answer once the running background training has finished
+                if self._training:
+                    self._pending_recommendation = (player_id, n_recommendations)
+                    return
                 self.train_models()
                 
             if self.knn_model is None:
@@ -159,32 +446,34 @@ class PlayerRecommender(QObject):
                 return
                 
             # Get player data
-            player_idx = self.players_df.index[self.players_df['player_id'] == player_id].tolist()
+            player_idx = self._player_rows.get(player_id)
             
-            if not player_idx:
+            if player_idx is None:
                 self.error_occurred.emit(f"Player with ID {player_id} not found")
                 return
             
-            player_idx = player_idx[0]
-            
-            # Preprocess data again to ensure consistency
-            X, _ = self.preprocess_data()
-            
-            if X is None:
-                return
+            # Reuse the training features, or transform only the reference player
+            # with the fitted pipeline if the data changed since training
+            if self._X is not None:
+                player_features = self._X[player_idx].reshape(1, -1)
+            else:
+                player_features = self._preprocessor.transform(self._X_raw[player_idx].reshape(1, -1))
                 
-            # Find similar players
-            distances, indices = self.knn_model.kneighbors(
-                X[player_idx].reshape(1, -1),
-                n_neighbors=n_recommendations + 1  # +1 because the player itself will be included
-            )
+            # Find similar players, searching the nearest clusters first and
+            # falling back to the full k-NN index
+            n_neighbors = n_recommendations + 1  # +1 because the player itself will be included
+            neighbors = self.find_cluster_neighbors(player_features, n_neighbors)
+            if neighbors is None:
+                distances, indices = self.knn_model.kneighbors(player_features, n_neighbors=n_neighbors)
+                neighbors = (distances.flatten(), indices.flatten())
+            distances, indices = neighbors
             
             # Remove the player itself (first result)
-            similar_indices = indices.flatten()[1:]
-            similar_distances = distances.flatten()[1:]
+            similar_indices = indices[1:]
+            similar_distances = distances[1:]
             
-            # Get similar players data
-            similar_players = self.players_df.iloc[similar_indices].copy()
+            # Get similar players data (indices refer to the training data)
+            similar_players = self._trained_df.iloc[similar_indices].copy()
             similar_players['similarity_score'] = 1 / (1 + similar_distances)
             
             # Emit recommendations
@@ -193,6 +482,41 @@ class PlayerRecommender(QObject):
         except Exception as e:
             self.error_occurred.emit(f"Error generating recommendations: {str(e)}")
     
+    def find_cluster_neighbors(self, player_features, n_neighbors, n_search_clusters=3):
+        """
+        Find the nearest players among the clusters closest to a player.
+        
+        Args:
+            player_features (np.ndarray): Preprocessed features of the reference player (1 x F)
+            n_neighbors (int): Number of neighbors to return
+            n_search_clusters (int, optional): Number of nearest clusters to search. Defaults to 3.
+        
+        Returns:
+            tuple: (distances, indices) into the training data, closest first, or None
+                if the full k-NN search should be used instead
+        """
+        if self.kmeans_model is None or self._train_X is None:
+            return None
+        
+        centers = self.kmeans_model.cluster_centers_
+        if len(centers) <= n_search_clusters:
+            return None
+        
+        # Members of the clusters whose centroids are closest to the player
+        center_distances = np.linalg.norm(centers - player_features, axis=1)
+        nearest_clusters = np.argpartition(center_distances, n_search_clusters)[:n_search_clusters]
+        candidates = np.concatenate([self._cluster_members[c] for c in nearest_clusters])
+        
+        if len(candidates) < n_neighbors:
+            return None
+        
+        # Exact distances within the candidate pool
+        distances = np.linalg.norm(self._train_X[candidates] - player_features, axis=1)
+        nearest = np.argpartition(distances, n_neighbors - 1)[:n_neighbors]
+        nearest = nearest[np.argsort(distances[nearest], kind='stable')]
+        
+        return distances[nearest], candidates[nearest]
+    
     @Slot(dict, int)
     def recommend_by_criteria(self, criteria, n_recommendations=5):
         """
@@ -207,30 +531,46 @@ class PlayerRecommender(QObject):
                 self.error_occurred.emit("No player data available")
                 return
             
-            # Filter by position if specified
-            filtered_df = self.players_df.copy()
+            # Build a single mask for all criteria and apply it once
+            players_df = self.players_df
+            mask = pd.Series(True, index=players_df.index)
             
+            # Filter by position if specified
             if 'position' in criteria and criteria['position']:
-                filtered_df = filtered_df[filtered_df['position'] == criteria['position']]
+                mask &= players_df['position'] == criteria['position']
+            
+            # Bounds on feature columns are collected per column (NaN when unconstrained)
+            # and checked in one pass over the float32 feature matrix
+            feature_idx = {col: j for j, col in enumerate(self._raw_features)}
+            min_arr = np.full(len(feature_idx), np.nan, dtype=np.float32)
+            max_arr = np.full(len(feature_idx), np.nan, dtype=np.float32)
             
             # Apply numeric filters
             for key, value in criteria.items():
                 if key.startswith('min_') and value is not None:
                     col_name = key[4:]  # Remove 'min_' prefix
-                    if col_name in filtered_df.columns:
-                        filtered_df = filtered_df[filtered_df[col_name] >= value]
+                    if col_name in feature_idx:
+                        min_arr[feature_idx[col_name]] = value
+                    elif col_name in players_df.columns:
+                        mask &= players_df[col_name] >= value
                 
                 elif key.startswith('max_') and value is not None:
                     col_name = key[4:]  # Remove 'max_' prefix
-                    if col_name in filtered_df.columns:
-                        filtered_df = filtered_df[filtered_df[col_name] <= value]
+                    if col_name in feature_idx:
+                        max_arr[feature_idx[col_name]] = value
+                    elif col_name in players_df.columns:
+                        mask &= players_df[col_name] <= value
             
-            # Sort by rating if available
-            if 'rating' in filtered_df.columns:
-                filtered_df = filtered_df.sort_values(by='rating', ascending=False)
+            if not (np.isnan(min_arr).all() and np.isnan(max_arr).all()):
+                mask &= filter_rows_in_bounds(self._X_raw, min_arr, max_arr)
+            
+            filtered_df = players_df[mask]
             
-            # Get top N recommendations
-            recommendations = filtered_df.head(n_recommendations)
+            # Get top N recommendations by rating if available
+            if 'rating' in filtered_df.columns:
+                recommendations = filtered_df.nlargest(n_recommendations, 'rating')
+            else:
+                recommendations = filtered_df.head(n_recommendations)
             
             self.recommendation_ready.emit(recommendations)
             
@@ -9,26 +9,36 @@ This module defines configuration settings for the application.
 
 import os
 import json
+import threading
+from functools import lru_cache
 from pathlib import Path
 
+from PySide6.QtCore import QCoreApplication, QThread, QTimer
+
+# Use orjson for reading and writing config.json when available, stdlib json otherwise.
+# Both write the same layout, so the unchanged-save check works whichever wrote the file.
+try:
+    import orjson
+    json_loads = orjson.loads
+    
+    def json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    json_loads = json.loads
+    
+    def json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 # Application directories
 APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(APP_DIR, 'data')
 CACHE_DIR = os.path.join(DATA_DIR, 'cache')
 CONFIG_FILE = os.path.join(DATA_DIR, 'config.json')
 
-# Ensure data directories exist
-os.makedirs(DATA_DIR, exist_ok=True)
-os.makedirs(CACHE_DIR, exist_ok=True)
-
-# Default API settings
-API_KEY = "719b4fb0c7bebee5994f4301fd8654e9"  # Your API-Sports key
-API_SOURCE = "apisports"  # Options: "rapidapi", "apisports", "mock"
-
 # Default settings
 DEFAULT_CONFIG = {
-    "api_key": API_KEY,
-    "api_source": API_SOURCE,  # Added API source setting
+    "api_key": "719b4fb0c7bebee5994f4301fd8654e9",  # Your API-Sports key
+    "api_source": "apisports",  # Options: "rapidapi", "apisports", "mock"
     "leagues": [
         {"id": 39, "name": "Premier League", "country": "England"},
         {"id": 140, "name": "La Liga", "country": "Spain"},
@@ -41,6 +51,35 @@ DEFAULT_CONFIG = {
     "cache_expiry_hours": 24
 }
 
+# Config keys edited in the settings dialog
+KEY_API_SOURCE = 'api_source'
+KEY_API_KEY = 'api_key'
+KEY_CACHE_EXPIRY = 'cache_expiry_hours'
+KEY_CURRENT_SEASON = 'current_season'
+SETTINGS_KEYS = (KEY_API_SOURCE, KEY_API_KEY, KEY_CACHE_EXPIRY, KEY_CURRENT_SEASON)
+
+# Settings read from config.json on first access (see __getattr__)
+LAZY_SETTINGS = frozenset({
+    'config', 'API_KEY', 'API_SOURCE', 'CURRENT_SEASON', 'THEME', 'CACHE_EXPIRY_HOURS', 'LEAGUES'
+})
+_loaded = False
+_load_lock = threading.Lock()
+
+# Parsed config.json with the modification time it was read at and its serialized form
+_config_cache = {'mtime': None, 'data': None, 'raw': None}
+
+# Saved configs are written to disk after this delay, coalescing rapid saves
+CONFIG_FLUSH_DELAY_MS = 500
+_dirty = False
+_flush_timer = None
+
+
+def ensure_data_dirs():
+    """Create the data and cache directories if they don't exist."""
+    for directory in (DATA_DIR, CACHE_DIR):
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+
 
 def load_config():
     """
@@ -49,18 +88,26 @@ def load_config():
     Returns:
         dict: Configuration settings
     """
-    if not os.path.exists(CONFIG_FILE):
+    # Directories are only created when the default config has to be written
+    if not _dirty and not os.path.exists(CONFIG_FILE):
         save_config(DEFAULT_CONFIG)
         return DEFAULT_CONFIG
     
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            config = json.load(f)
+        # Serve the parsed file from memory unless it changed on disk;
+        # a saved config that is not flushed yet is newer than the file
+        mtime = None if _dirty else os.stat(CONFIG_FILE).st_mtime
+        if _dirty or mtime == _config_cache['mtime']:
+            config = _config_cache['data']
+        else:
+            raw = Path(CONFIG_FILE).read_bytes()
+            config = json_loads(raw)
+            _config_cache.update(mtime=mtime, data=config, raw=raw)
         
         # Update API settings from config
         global API_KEY, API_SOURCE
-        API_KEY = config.get('api_key', API_KEY)
-        API_SOURCE = config.get('api_source', API_SOURCE)
+        API_KEY = config.get('api_key', DEFAULT_CONFIG['api_key'])
+        API_SOURCE = config.get('api_source', DEFAULT_CONFIG['api_source'])
         
         return config
     except Exception as e:
@@ -70,30 +117,74 @@ def load_config():
 
 def save_config(config):
     """
-    Save configuration to file.
+    Save configuration; it is used from memory at once and written to file shortly after.
     
     Args:
         config (dict): Configuration settings
     """
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
+        # Nothing to write if config.json already holds (or will hold) exactly this config
+        raw = json_dumps(config)
+        if raw == _config_cache['raw'] and (_dirty or os.path.exists(CONFIG_FILE)):
+            return
+        
+        _config_cache.update(data=config, raw=raw)
+        mark_dirty()
     except Exception as e:
         print(f"Error saving config: {e}")
 
 
-# Load config at module import
-config = load_config()
+def mark_dirty():
+    """Schedule writing the cached config to file, restarting the delay if one is pending."""
+    global _dirty, _flush_timer
+    _dirty = True
+    
+    # Without a running Qt application in this thread, write at once
+    app = QCoreApplication.instance()
+    if app is None or QThread.currentThread() is not app.thread():
+        flush()
+        return
+    
+    if _flush_timer is None:
+        _flush_timer = QTimer(app)
+        _flush_timer.setSingleShot(True)
+        _flush_timer.setInterval(CONFIG_FLUSH_DELAY_MS)
+        _flush_timer.timeout.connect(flush)
+        
+        # Pending changes must not be lost when the application exits
+        app.aboutToQuit.connect(flush)
+    _flush_timer.start()
 
-# Override constants with loaded config
-API_KEY = config.get('api_key', API_KEY)
-API_SOURCE = config.get('api_source', API_SOURCE)
-CURRENT_SEASON = config.get('current_season', DEFAULT_CONFIG['current_season'])
-THEME = config.get('theme', DEFAULT_CONFIG['theme'])
-CACHE_EXPIRY_HOURS = config.get('cache_expiry_hours', DEFAULT_CONFIG['cache_expiry_hours'])
-LEAGUES = config.get('leagues', DEFAULT_CONFIG['leagues'])
+
+def flush():
+    """Write the cached config to file if it has unsaved changes."""
+    global _dirty
+    if not _dirty:
+        return
+    _dirty = False
+    
+    # Write the serialized config in one call to a temporary file and swap it in,
+    # so a failed write never leaves a truncated config.json behind
+    tmp_file = CONFIG_FILE + '.tmp'
+    try:
+        ensure_data_dirs()
+        with open(tmp_file, 'wb') as f:
+            f.write(_config_cache['raw'])
+        os.replace(tmp_file, CONFIG_FILE)
+        
+        # Keep serving the saved config from memory instead of parsing it again
+        _config_cache['mtime'] = os.stat(CONFIG_FILE).st_mtime
+    except Exception as e:
+        print(f"Error saving config: {e}")
+        
+        # Don't leave a partial temporary file behind
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
 
 
+@lru_cache(maxsize=64)
 def get_league_name(league_id):
     """
     Get league name from ID.
@@ -104,12 +195,11 @@ def get_league_name(league_id):
     Returns:
         str: League name, or None if not found
     """
-    for league in LEAGUES:
-        if league['id'] == league_id:
-            return league['name']
-    return None
+    ensure_loaded()
+    return _LEAGUE_NAMES.get(league_id)
 
 
+@lru_cache(maxsize=64)
 def get_league_country(league_id):
     """
     Get league country from ID.
@@ -120,7 +210,79 @@ def get_league_country(league_id):
     Returns:
         str: League country, or None if not found
     """
-    for league in LEAGUES:
-        if league['id'] == league_id:
-            return league['country']
-    return None
\ No newline at end of file
+    ensure_loaded()
+    return _LEAGUE_COUNTRIES.get(league_id)
+
+
+def iter_leagues():
+    """
+    Iterate over the configured leagues.
+    
+    Returns:
+        iterator: (league_id, name, country) tuples, one per league
+    """
+    ensure_loaded()
+    return zip(*_LEAGUES_SOA)
+
+
+def reload_config():
+    """
+    Reload configuration from file and refresh the derived settings.
+    
+    Returns:
+        dict: Configuration settings
+    """
+    global config, API_KEY, API_SOURCE, CURRENT_SEASON, THEME, CACHE_EXPIRY_HOURS, LEAGUES
+    global _LEAGUE_NAMES, _LEAGUE_COUNTRIES, _LEAGUES_SOA, _loaded
+    
+    config = load_config()
+    
+    # Override constants with loaded config
+    API_KEY = config.get('api_key', DEFAULT_CONFIG['api_key'])
+    API_SOURCE = config.get('api_source', DEFAULT_CONFIG['api_source'])
+    CURRENT_SEASON = config.get('current_season', DEFAULT_CONFIG['current_season'])
+    THEME = config.get('theme', DEFAULT_CONFIG['theme'])
+    CACHE_EXPIRY_HOURS = config.get('cache_expiry_hours', DEFAULT_CONFIG['cache_expiry_hours'])
+    LEAGUES = config.get('leagues', DEFAULT_CONFIG['leagues'])
+    
+    # League lookups by ID, rebuilt whenever LEAGUES changes
+    _LEAGUE_NAMES = {league['id']: league['name'] for league in LEAGUES}
+    _LEAGUE_COUNTRIES = {league['id']: league['country'] for league in LEAGUES}
+    
+    # Leagues as parallel (ids, names, countries) tuples for iter_leagues
+    _LEAGUES_SOA = (
+        tuple(league['id'] for league in LEAGUES),
+        tuple(league['name'] for league in LEAGUES),
+        tuple(league['country'] for league in LEAGUES)
+    )
+    get_league_name.cache_clear()
+    get_league_country.cache_clear()
+    
+    _loaded = True
+    return config
+
+
+def ensure_loaded():
+    """Load the configuration once, on first access to a setting."""
+    if _loaded:
+        return
+    
+    with _load_lock:
+        if not _loaded:
+            reload_config()
+
+
+def __getattr__(name):
+    """
+    Load settings from config.json the first time one of them is read (PEP 562).
+    
+    Args:
+        name (str): Attribute name
+    
+    Returns:
+        object: Setting value
+    """
+    if name in LAZY_SETTINGS:
+        ensure_loaded()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Workers Module
+
+This module provides helpers for running work on a QThreadPool so that
+long-running tasks do not block the GUI thread.
+"""
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by a Worker.
+    
+    QRunnable is not a QObject, so the signals live on a separate object.
+    Receivers in the GUI thread get them through queued connections.
+    """
+    
+    finished = Signal(object)  # Signal emitted with the function's return value
+    error = Signal(str)  # Signal emitted with the error message if the function raises
+
+
+class Worker(QRunnable):
+    """
+    Runnable that calls a function on a thread pool thread.
+    """
+    
+    def __init__(self, fn, *args, **kwargs):
+        """
+        Initialize the worker.
+        
+        Args:
+            fn (callable): Function to run
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+        """
+        super().__init__()
+        
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        """Run the function and emit its result or error."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
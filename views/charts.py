@@ -8,14 +8,103 @@ This module implements custom chart components for visualizing player
 and team statistics.
 """
 
+from collections import OrderedDict
+from functools import lru_cache
+
 import numpy as np
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGraphicsPathItem
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
 import pyqtgraph as pg
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+
+# Default slice colors for pie charts
+PIE_COLORS = [
+    '#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
+    '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf'
+]
+
+# Default series color and axis color
+DEFAULT_COLOR = (52, 152, 219)
+AXIS_COLOR = (0, 0, 0)
+
+# Number of heat map lookup tables kept per widget
+LUT_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=None)
+def shared_brush(color):
+    """
+    Get a brush shared by every chart, created on first use.
+    
+    The returned brush must not be modified.
+    
+    Args:
+        color (tuple or str): Hashable color specification
+    
+    Returns:
+        QBrush: Shared brush
+    """
+    return pg.mkBrush(color)
+
+
+@lru_cache(maxsize=None)
+def shared_pen(color, width=1):
+    """
+    Get a pen shared by every chart, created on first use.
+    
+    The returned pen must not be modified.
+    
+    Args:
+        color (tuple or str): Hashable color specification, or None for no pen
+        width (int, optional): Line width. Defaults to 1.
+    
+    Returns:
+        QPen: Shared pen
+    """
+    return pg.mkPen(color, width=width)
+
+
+def make_polygon_item(x, y, color, alpha=1.0):
+    """
+    Create a filled graphics item for a closed polygon.
+    
+    Args:
+        x (np.ndarray): X coordinates of the polygon vertices
+        y (np.ndarray): Y coordinates of the polygon vertices
+        color (str or tuple): Fill color
+        alpha (float, optional): Fill transparency. Defaults to 1.0.
+    
+    Returns:
+        QGraphicsPathItem: Polygon item ready to be added to a plot
+    """
+    path = pg.arrayToQPath(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+    path.closeSubpath()
+    
+    fill_color = pg.mkColor(color)
+    fill_color.setAlphaF(alpha)
+    
+    item = QGraphicsPathItem(path)
+    item.setBrush(pg.mkBrush(fill_color))
+    item.setPen(shared_pen('w'))
+    return item
+
+
+def create_polar_plot():
+    """
+    Create a plot widget set up for drawing circular charts.
+    
+    Returns:
+        pg.PlotWidget: Plot with hidden axes, a locked aspect ratio and no mouse interaction
+    """
+    plot = pg.PlotWidget()
+    plot.setBackground('w')
+    plot.hideAxis('left')
+    plot.hideAxis('bottom')
+    plot.setAspectLocked(True)
+    plot.setMouseEnabled(x=False, y=False)
+    plot.hideButtons()
+    return plot
 
 
 class BarChartWidget(pg.PlotWidget):
@@ -37,8 +126,8 @@ class BarChartWidget(pg.PlotWidget):
         self.setBackground('w')
         
         # Configure axes
-        self.getAxis('left').setPen((0, 0, 0))
-        self.getAxis('bottom').setPen((0, 0, 0))
+        self.getAxis('left').setPen(shared_pen(AXIS_COLOR))
+        self.getAxis('bottom').setPen(shared_pen(AXIS_COLOR))
         
         # Add title if provided
         if title:
@@ -61,11 +150,11 @@ class BarChartWidget(pg.PlotWidget):
             name (str, optional): Name for legend. Defaults to None.
         """
         x = np.arange(len(categories))
-        bar_item = pg.BarGraphItem(x=x, height=values, width=0.6, brush=color or (52, 152, 219), name=name)
+        bar_item = pg.BarGraphItem(x=x, height=values, width=0.6, brush=color or shared_brush(DEFAULT_COLOR), name=name)
         self.addItem(bar_item)
         
         # Set x-axis labels
-        self.getAxis('bottom').setTicks([[(i, cat) for i, cat in enumerate(categories)]])
+        self.getAxis('bottom').setTicks([list(enumerate(categories))])
     
     def plot_grouped_bars(self, categories, data_sets, colors=None, names=None):
         """
@@ -80,12 +169,16 @@ class BarChartWidget(pg.PlotWidget):
         num_sets = len(data_sets)
         bar_width = 0.8 / num_sets
         
+        # Base category positions and the offset of each data set, computed once
+        base = np.arange(len(categories), dtype=np.float64)
+        offsets = (np.arange(num_sets) - num_sets / 2 + 0.5) * bar_width
+        
         for i, values in enumerate(data_sets):
             # Calculate x positions for this data set
-            x = np.arange(len(categories)) + (i - num_sets/2 + 0.5) * bar_width
+            x = base + offsets[i]
             
             # Get color and name
-            color = colors[i] if colors and i < len(colors) else (52, 152, 219)
+            color = colors[i] if colors and i < len(colors) else shared_brush(DEFAULT_COLOR)
             name = names[i] if names and i < len(names) else f"Data {i+1}"
             
             # Create and add bar item
@@ -93,12 +186,12 @@ class BarChartWidget(pg.PlotWidget):
             self.addItem(bar_item)
         
         # Set x-axis labels
-        self.getAxis('bottom').setTicks([[(i, cat) for i, cat in enumerate(categories)]])
+        self.getAxis('bottom').setTicks([list(enumerate(categories))])
 
 
 class PieChartWidget(QWidget):
     """
-    Custom pie chart widget based on Matplotlib.
+    Custom pie chart widget based on PyQtGraph.
     """
     
     def __init__(self, title=None, parent=None):
@@ -122,13 +215,9 @@ class PieChartWidget(QWidget):
             title_label.setAlignment(Qt.AlignCenter)
             layout.addWidget(title_label)
         
-        # Create matplotlib figure and canvas
-        self.fig = plt.figure(figsize=(5, 5))
-        self.canvas = FigureCanvas(self.fig)
-        layout.addWidget(self.canvas)
-        
-        # Create subplot
-        self.ax = self.fig.add_subplot(111)
+        # Create plot
+        self.plot = create_polar_plot()
+        layout.addWidget(self.plot)
     
     def plot_pie(self, labels, values, colors=None, explode=None):
         """
@@ -141,31 +230,57 @@ class PieChartWidget(QWidget):
             explode (list, optional): List of explosion values. Defaults to None.
         """
         # Clear previous plot
-        self.ax.clear()
-        
-        # Create pie chart
-        self.ax.pie(
-            values,
-            labels=labels,
-            colors=colors,
-            explode=explode,
-            autopct='%1.1f%%',
-            shadow=True,
-            startangle=90
-        )
+        self.plot.clear()
+        
+        values = np.asarray(values, dtype=np.float64)
+        total = values.sum()
+        if total <= 0:
+            return
+        
+        # Set defaults
+        colors = colors or PIE_COLORS
+        explode = np.zeros(len(values)) if explode is None else np.asarray(explode, dtype=np.float64)
         
-        # Equal aspect ratio ensures that pie is drawn as a circle
-        self.ax.axis('equal')
+        # Slice boundaries, counterclockwise from the top
+        fractions = values / total
+        bounds = np.pi / 2 + 2 * np.pi * np.concatenate([[0.0], np.cumsum(fractions)])
         
-        # Redraw canvas
-        self.canvas.draw()
+        for i, fraction in enumerate(fractions):
+            start, end = bounds[i], bounds[i + 1]
+            mid = (start + end) / 2
+            
+            # Offset of the slice center for exploded slices
+            dx = explode[i] * np.cos(mid)
+            dy = explode[i] * np.sin(mid)
+            
+            # Wedge outline: center, points along the arc, back to center
+            theta = np.linspace(start, end, max(2, int(np.ceil(fraction * 100)) + 1))
+            x = np.concatenate([[0.0], np.cos(theta), [0.0]]) + dx
+            y = np.concatenate([[0.0], np.sin(theta), [0.0]]) + dy
+            self.plot.addItem(make_polygon_item(x, y, colors[i % len(colors)]))
+            
+            # Slice label outside the wedge, percentage inside
+            label = pg.TextItem(str(labels[i]), color='k', anchor=(0.5, 0.5))
+            label.setPos(1.15 * np.cos(mid) + dx, 1.15 * np.sin(mid) + dy)
+            self.plot.addItem(label)
+            
+            percent = pg.TextItem(f"{fraction * 100:.1f}%", color='k', anchor=(0.5, 0.5))
+            percent.setPos(0.6 * np.cos(mid) + dx, 0.6 * np.sin(mid) + dy)
+            self.plot.addItem(percent)
+        
+        # Leave room for the labels around the pie
+        limit = 1.4 + explode.max(initial=0)
+        self.plot.setRange(xRange=(-limit, limit), yRange=(-limit, limit), padding=0)
 
 
 class RadarChartWidget(QWidget):
     """
-    Custom radar chart widget based on Matplotlib.
+    Custom radar chart widget based on PyQtGraph.
     """
     
+    # Radial grid levels and their labels
+    GRID_LEVELS = (0.2, 0.4, 0.6, 0.8, 1.0)
+    
     def __init__(self, title=None, parent=None):
         """
         Initialize the radar chart widget.
@@ -187,13 +302,74 @@ class RadarChartWidget(QWidget):
             title_label.setAlignment(Qt.AlignCenter)
             layout.addWidget(title_label)
         
-        # Create matplotlib figure and canvas
-        self.fig = plt.figure(figsize=(5, 5))
-        self.canvas = FigureCanvas(self.fig)
-        layout.addWidget(self.canvas)
+        # Create plot
+        self.plot = create_polar_plot()
+        layout.addWidget(self.plot)
+        
+        # Items from the last plot_radar call, updated in place on redraw
+        self._radar_line = None
+        self._radar_fill = None
+        self._radar_layout = None
+        
+        # Closed-loop angle arrays by number of variables
+        self._angle_cache = {}
+    
+    def radar_angles(self, N):
+        """
+        Get the angle of each variable, with the first angle repeated to close the loop.
+        
+        Args:
+            N (int): Number of variables
+        
+        Returns:
+            np.ndarray: Read-only array of N + 1 angles in radians
+        """
+        angles = self._angle_cache.get(N)
+        if angles is None:
+            angles = np.linspace(0, 2 * np.pi, N + 1)
+            angles[-1] = angles[0]
+            angles.setflags(write=False)
+            self._angle_cache[N] = angles
+        return angles
+    
+    def draw_grid(self, labels, angles):
+        """
+        Clear the plot and draw the radial grid with variable and level labels.
+        
+        Args:
+            labels (list): List of attribute names
+            angles (np.ndarray): Closed-loop angles from radar_angles
+        """
+        self.plot.clear()
+        
+        grid_pen = shared_pen((200, 200, 200))
+        
+        # Concentric circles with percentage labels
+        circle = np.linspace(0, 2 * np.pi, 100)
+        for level in self.GRID_LEVELS:
+            self.plot.addItem(pg.PlotDataItem(level * np.cos(circle), level * np.sin(circle), pen=grid_pen))
+            
+            level_label = pg.TextItem(f"{level * 100:.0f}%", color=(120, 120, 120), anchor=(0, 1))
+            level_label.setPos(0, level)
+            self.plot.addItem(level_label)
+        
+        # Spokes and labels for each variable
+        for angle, label in zip(angles[:-1], labels):
+            self.plot.addItem(pg.PlotDataItem([0, np.cos(angle)], [0, np.sin(angle)], pen=grid_pen))
+            
+            text = pg.TextItem(str(label), color='k', anchor=(0.5, 0.5))
+            text.setPos(1.15 * np.cos(angle), 1.15 * np.sin(angle))
+            self.plot.addItem(text)
+    
+    def fit_range(self, max_radius):
+        """
+        Fit the view to the grid and the plotted radars.
         
-        # Create subplot (polar projection for radar chart)
-        self.ax = self.fig.add_subplot(111, polar=True)
+        Args:
+            max_radius (float): Largest normalized value plotted
+        """
+        limit = 1.35 * max(1.0, max_radius)
+        self.plot.setRange(xRange=(-limit, limit), yRange=(-limit, limit), padding=0)
     
     def plot_radar(self, labels, values, max_values=None, color=None, fill=True, alpha=0.3):
         """
@@ -207,9 +383,6 @@ class RadarChartWidget(QWidget):
             fill (bool, optional): Whether to fill the radar. Defaults to True.
             alpha (float, optional): Fill transparency. Defaults to 0.3.
         """
-        # Clear previous plot
-        self.ax.clear()
-        
         # Number of variables
         N = len(labels)
         
@@ -217,36 +390,45 @@ class RadarChartWidget(QWidget):
         if max_values is None:
             max_values = [100] * N
         
-        # Compute angle for each variable
-        angles = [n / float(N) * 2 * np.pi for n in range(N)]
-        angles += angles[:1]  # Close the loop
+        # Angle for each variable, with the loop closed
+        angles = self.radar_angles(N)
         
         # Normalize values
-        normalized_values = [v / m for v, m in zip(values, max_values)]
-        normalized_values += normalized_values[:1]  # Close the loop
+        normalized_values = np.asarray(values, dtype=np.float64) / np.asarray(max_values, dtype=np.float64)
+        normalized_values = np.concatenate([normalized_values, normalized_values[:1]])  # Close the loop
+        
+        # Polygon vertices in plot coordinates
+        x = np.cos(angles) * normalized_values
+        y = np.sin(angles) * normalized_values
         
         # Set default color
         color = color or '#3498db'
         
-        # Draw the radar
-        self.ax.plot(angles, normalized_values, linewidth=2, linestyle='solid', color=color)
-        
-        if fill:
-            self.ax.fill(angles, normalized_values, alpha=alpha, color=color)
-        
-        # Add labels
-        self.ax.set_xticks(angles[:-1])
-        self.ax.set_xticklabels(labels)
-        
-        # Set y-ticks
-        self.ax.set_yticks([0.2, 0.4, 0.6, 0.8, 1.0])
-        self.ax.set_yticklabels(['20%', '40%', '60%', '80%', '100%'])
-        
-        # Add grid
-        self.ax.grid(True)
-        
-        # Redraw canvas
-        self.canvas.draw()
+        # Rebuild the grid only when the attributes changed
+        layout = (list(labels), fill)
+        if self._radar_line is None or layout != self._radar_layout:
+            self.draw_grid(labels, angles)
+            
+            self._radar_fill = make_polygon_item(x, y, color, alpha) if fill else None
+            if self._radar_fill is not None:
+                self._radar_fill.setPen(shared_pen(None))
+                self.plot.addItem(self._radar_fill)
+            
+            self._radar_line = pg.PlotDataItem()
+            self.plot.addItem(self._radar_line)
+            self._radar_layout = layout
+        
+        # Update the radar items in place
+        self._radar_line.setData(x, y, pen=pg.mkPen(color, width=2))
+        if self._radar_fill is not None:
+            path = pg.arrayToQPath(x, y)
+            path.closeSubpath()
+            fill_color = pg.mkColor(color)
+            fill_color.setAlphaF(alpha)
+            self._radar_fill.setPath(path)
+            self._radar_fill.setBrush(pg.mkBrush(fill_color))
+        
+        self.fit_range(normalized_values.max(initial=0))
     
     def compare_radar(self, labels, values_list, labels_list, max_values=None, colors=None, alpha=0.3):
         """
@@ -260,9 +442,6 @@ class RadarChartWidget(QWidget):
             colors (list, optional): List of colors for each radar. Defaults to None.
             alpha (float, optional): Fill transparency. Defaults to 0.3.
         """
-        # Clear previous plot
-        self.ax.clear()
-        
         # Number of variables
         N = len(labels)
         
@@ -270,43 +449,43 @@ class RadarChartWidget(QWidget):
         if max_values is None:
             max_values = [100] * N
         
-        # Compute angle for each variable
-        angles = [n / float(N) * 2 * np.pi for n in range(N)]
-        angles += angles[:1]  # Close the loop
+        # Angle for each variable, with the loop closed
+        angles = self.radar_angles(N)
+        
+        # Clear previous plot and draw the grid
+        self.draw_grid(labels, angles)
+        self._radar_line = None
         
         # Default colors
         if colors is None:
             colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12']
         
+        # Normalize all radars in one broadcast (one row per radar) and close the loops
+        normalized = np.asarray(values_list, dtype=np.float64) / np.asarray(max_values, dtype=np.float64)
+        normalized = np.hstack([normalized, normalized[:, :1]])
+        
+        # Polygon vertices for every radar
+        xs = np.cos(angles) * normalized
+        ys = np.sin(angles) * normalized
+        
+        # Add legend
+        legend = self.plot.addLegend(offset=(-10, 10))
+        
         # Plot each radar
-        for i, values in enumerate(values_list):
-            # Normalize values
-            normalized_values = [v / m for v, m in zip(values, max_values)]
-            normalized_values += normalized_values[:1]  # Close the loop
-            
+        for i, (x, y) in enumerate(zip(xs, ys)):
             # Get color
             color = colors[i % len(colors)]
             
             # Draw the radar
-            self.ax.plot(angles, normalized_values, linewidth=2, linestyle='solid', color=color, label=labels_list[i])
-            self.ax.fill(angles, normalized_values, alpha=alpha, color=color)
-        
-        # Add labels
-        self.ax.set_xticks(angles[:-1])
-        self.ax.set_xticklabels(labels)
-        
-        # Set y-ticks
-        self.ax.set_yticks([0.2, 0.4, 0.6, 0.8, 1.0])
-        self.ax.set_yticklabels(['20%', '40%', '60%', '80%', '100%'])
-        
-        # Add grid
-        self.ax.grid(True)
-        
-        # Add legend
-        self.ax.legend(loc='upper right', bbox_to_anchor=(0.1, 0.1))
+            fill_item = make_polygon_item(x, y, color, alpha)
+            fill_item.setPen(shared_pen(None))
+            self.plot.addItem(fill_item)
+            
+            line = pg.PlotDataItem(x, y, pen=pg.mkPen(color, width=2))
+            self.plot.addItem(line)
+            legend.addItem(line, labels_list[i])
         
-        # Redraw canvas
-        self.canvas.draw()
+        self.fit_range(normalized.max(initial=0))
 
 
 class ScatterPlotWidget(pg.PlotWidget):
@@ -328,8 +507,8 @@ class ScatterPlotWidget(pg.PlotWidget):
         self.setBackground('w')
         
         # Configure axes
-        self.getAxis('left').setPen((0, 0, 0))
-        self.getAxis('bottom').setPen((0, 0, 0))
+        self.getAxis('left').setPen(shared_pen(AXIS_COLOR))
+        self.getAxis('bottom').setPen(shared_pen(AXIS_COLOR))
         
         # Add title if provided
         if title:
@@ -354,35 +533,31 @@ class ScatterPlotWidget(pg.PlotWidget):
             name (str, optional): Name for legend. Defaults to None.
             symbol (str, optional): Point symbol. Defaults to 'o'.
         """
-        # Create scatter plot item
+        # One brush shared by every point and the legend
+        brush = pg.mkBrush(color) if color else shared_brush(DEFAULT_COLOR)
+        
+        # Create scatter plot item (size, pen and brush apply to all points)
         scatter = pg.ScatterPlotItem(
             size=size,
-            pen=pg.mkPen(None),
-            brush=pg.mkBrush(color or (52, 152, 219)),
+            pen=shared_pen(None),
+            brush=brush,
             symbol=symbol
         )
         
-        # Create data points
-        spots = []
-        for i in range(len(x_data)):
-            spot = {
-                'pos': (x_data[i], y_data[i]),
-                'size': size,
-                'brush': pg.mkBrush(color or (52, 152, 219))
-            }
-            
-            if labels and i < len(labels):
-                spot['data'] = labels[i]
-            
-            spots.append(spot)
-        
-        scatter.addPoints(spots)
+        # Add all data points in one call
+        x = np.asarray(x_data)
+        y = np.asarray(y_data)
+        if labels:
+            data = list(labels[:len(x)]) + [None] * (len(x) - len(labels))
+            scatter.addPoints(x=x, y=y, data=data)
+        else:
+            scatter.addPoints(x=x, y=y)
         self.addItem(scatter)
         
         # Add legend item if name is provided
         if name:
             self.plot([0], [0], pen=None, symbol=symbol, symbolSize=size, 
-                     symbolBrush=pg.mkBrush(color or (52, 152, 219)), name=name)
+                     symbolBrush=brush, name=name)
     
     def add_regression_line(self, x_data, y_data, color=None, width=2, name=None):
         """
@@ -396,18 +571,20 @@ class ScatterPlotWidget(pg.PlotWidget):
             name (str, optional): Name for legend. Defaults to None.
         """
         # Convert to numpy arrays
-        x = np.array(x_data)
-        y = np.array(y_data)
+        x = np.ascontiguousarray(x_data, dtype=np.float64)
+        y = np.ascontiguousarray(y_data, dtype=np.float64)
         
-        # Compute the linear regression
-        slope, intercept = np.polyfit(x, y, 1)
+        # Compute the least-squares line in closed form
+        x_centered = x - x.mean()
+        slope = (x_centered * (y - y.mean())).sum() / (x_centered ** 2).sum()
+        intercept = y.mean() - slope * x.mean()
         
         # Create line points
-        x_line = np.array([min(x), max(x)])
+        x_line = np.array([x.min(), x.max()])
         y_line = slope * x_line + intercept
         
         # Create line
-        pen = pg.mkPen(color=color or (255, 0, 0), width=width)
+        pen = pg.mkPen(color=color, width=width) if color else shared_pen((255, 0, 0), width)
         self.plot(x_line, y_line, pen=pen, name=name)
 
 
@@ -430,8 +607,8 @@ class HeatMapWidget(pg.PlotWidget):
         self.setBackground('w')
         
         # Configure axes
-        self.getAxis('left').setPen((0, 0, 0))
-        self.getAxis('bottom').setPen((0, 0, 0))
+        self.getAxis('left').setPen(shared_pen(AXIS_COLOR))
+        self.getAxis('bottom').setPen(shared_pen(AXIS_COLOR))
         
         # Add title if provided
         if title:
@@ -441,7 +618,11 @@ class HeatMapWidget(pg.PlotWidget):
         self.getViewBox().setMouseEnabled(x=False, y=False)
         
         # Store the color map
-        self.colormap = pg.colormap.get('viridis')
+        self.colormap_name = 'viridis'
+        self.colormap = pg.colormap.get(self.colormap_name)
+        
+        # Lookup tables by (colormap name, min, max), reused across redraws (least recently used first)
+        self._lut_cache = OrderedDict()
     
     def plot_heatmap(self, data, row_labels=None, col_labels=None, colormap=None, min_value=None, max_value=None):
         """
@@ -459,10 +640,11 @@ class HeatMapWidget(pg.PlotWidget):
         self.clear()
         
         # Convert data to numpy array if it's not already
-        data = np.array(data)
+        data = np.asarray(data)
         
         # Set colormap
-        if colormap:
+        if colormap and colormap != self.colormap_name:
+            self.colormap_name = colormap
             self.colormap = pg.colormap.get(colormap)
         
         # Create image item
@@ -476,7 +658,15 @@ class HeatMapWidget(pg.PlotWidget):
             max_value = np.max(data)
         
         # Set color map on the image
-        heatmap.setLookupTable(self.colormap.getLookupTable(min_value, max_value, 256))
+        lut_key = (self.colormap_name, round(float(min_value), 6), round(float(max_value), 6))
+        lut = self._lut_cache.get(lut_key)
+        if lut is None:
+            lut = self._lut_cache[lut_key] = self.colormap.getLookupTable(min_value, max_value, 256)
+            if len(self._lut_cache) > LUT_CACHE_SIZE:
+                self._lut_cache.popitem(last=False)
+        else:
+            self._lut_cache.move_to_end(lut_key)
+        heatmap.setLookupTable(lut)
         
         # Set data
         heatmap.setImage(data)
@@ -9,16 +9,83 @@ and visualizations.
 """
 
 import os
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
     QPushButton, QGridLayout, QScrollArea
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, Signal, Slot, QTimer
 from PySide6.QtGui import QFont, QPixmap, QColor
 
 import pyqtgraph as pg
 import numpy as np
 
+# Render plots through OpenGL when PyOpenGL is installed
+try:
+    import OpenGL  # noqa: F401
+    HAS_OPENGL = True
+except ImportError:
+    HAS_OPENGL = False
+
+pg.setConfigOptions(
+    useOpenGL=HAS_OPENGL,
+    enableExperimental=HAS_OPENGL,
+    antialias=False,
+    background='w',
+    foreground='k'
+)
+
+# Number of player rows created at a time; more are added as the list is scrolled
+PLAYER_ROW_BATCH = 20
+
+# Columns shown in a player row, passed to update_top_players as one sequence each
+PLAYER_ROW_COLUMNS = (
+    'player_id', 'name', 'team_name', 'rating', 'goals_total', 'assists', 'minutes_played'
+)
+
+# Card and row styles, applied once on the dashboard and matched by type selector
+STATCARD_QSS = """
+StatCard {
+    background-color: #f8f9fa;
+    border-radius: 5px;
+    border: 1px solid #dee2e6;
+}
+StatCard:hover {
+    background-color: #e9ecef;
+}
+"""
+
+PLAYERROW_QSS = """
+PlayerRow {
+    background-color: #ffffff;
+    border-radius: 5px;
+    border: 1px solid #dee2e6;
+    padding: 5px;
+    margin: 2px;
+}
+PlayerRow:hover {
+    background-color: #f8f9fa;
+}
+"""
+
+
+@lru_cache(maxsize=None)
+def shared_font(size, bold=False):
+    """
+    Get an Arial font shared by the dashboard widgets, created on first use.
+    
+    Qt copies the font in setFont, so one instance can be handed to every widget.
+    
+    Args:
+        size (int): Point size
+        bold (bool, optional): Whether the font is bold. Defaults to False.
+    
+    Returns:
+        QFont: Shared font
+    """
+    return QFont("Arial", size, QFont.Bold if bold else QFont.Normal)
+
 
 class StatCard(QFrame):
     """
@@ -34,16 +101,6 @@ class StatCard(QFrame):
         # Set card style
         self.setFrameShape(QFrame.StyledPanel)
         self.setFrameShadow(QFrame.Raised)
-        self.setStyleSheet("""
-            StatCard {
-                background-color: #f8f9fa;
-                border-radius: 5px;
-                border: 1px solid #dee2e6;
-            }
-            StatCard:hover {
-                background-color: #e9ecef;
-            }
-        """)
         
         # Make the card clickable
         self.setMouseTracking(True)
@@ -53,20 +110,33 @@ class StatCard(QFrame):
         
         # Title
         self.title_label = QLabel(title)
-        self.title_label.setFont(QFont("Arial", 10, QFont.Bold))
+        self.title_label.setFont(shared_font(10, bold=True))
         layout.addWidget(self.title_label)
         
         # Value
         self.value_label = QLabel(str(value))
-        self.value_label.setFont(QFont("Arial", 16, QFont.Bold))
+        self.value_label.setFont(shared_font(16, bold=True))
         self.value_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.value_label)
         
-        # Subtitle (optional)
-        if subtitle:
-            self.subtitle_label = QLabel(subtitle)
-            self.subtitle_label.setAlignment(Qt.AlignCenter)
-            layout.addWidget(self.subtitle_label)
+        # Subtitle (optional, hidden while empty)
+        self.subtitle_label = QLabel(subtitle or '')
+        self.subtitle_label.setAlignment(Qt.AlignCenter)
+        self.subtitle_label.setVisible(bool(subtitle))
+        layout.addWidget(self.subtitle_label)
+    
+    def set_value(self, value, subtitle=None):
+        """
+        Update the card's labels in place.
+        
+        Args:
+            value (object): Value to display
+            subtitle (str, optional): New subtitle. Defaults to None, which keeps the current one.
+        """
+        self.value_label.setText(str(value))
+        if subtitle is not None:
+            self.subtitle_label.setText(subtitle)
+            self.subtitle_label.setVisible(bool(subtitle))
     
     def mousePressEvent(self, event):
         """Handle mouse press events to emit clicked signal."""
@@ -81,78 +151,83 @@ class PlayerRow(QFrame):
     
     player_clicked = Signal(int)  # Signal emitted when player is clicked, with player ID
     
+    # Stat fields shown on the right of the row, as (column, label)
+    STAT_FIELDS = (
+        ('rating', 'Rating'),
+        ('goals_total', 'Goals'),
+        ('assists', 'Assists'),
+        ('minutes_played', 'Minutes')
+    )
+    
     def __init__(self, player_data, parent=None):
         """Initialize the player row."""
         super().__init__(parent)
         
         # Set frame style
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet("""
-            PlayerRow {
-                background-color: #ffffff;
-                border-radius: 5px;
-                border: 1px solid #dee2e6;
-                padding: 5px;
-                margin: 2px;
-            }
-            PlayerRow:hover {
-                background-color: #f8f9fa;
-            }
-        """)
-        
-        # Store player ID
-        self.player_id = player_data.get('player_id')
         
-        # Create layout
-        layout = QHBoxLayout(self)
+        # Create a single grid layout: rank | name/team | spacer | one column per stat
+        layout = QGridLayout(self)
         layout.setContentsMargins(10, 5, 10, 5)
+        layout.setHorizontalSpacing(15)
         
         # Player rank/position
-        self.rank_label = QLabel(f"#{player_data.get('rank', '')}")
+        self.rank_label = QLabel()
         self.rank_label.setFixedWidth(30)
-        layout.addWidget(self.rank_label)
+        layout.addWidget(self.rank_label, 0, 0, 2, 1)
         
         # Player name and team
-        player_info = QVBoxLayout()
-        self.name_label = QLabel(player_data.get('name', 'Unknown Player'))
-        self.name_label.setFont(QFont("Arial", 11, QFont.Bold))
-        player_info.addWidget(self.name_label)
+        self.name_label = QLabel()
+        self.name_label.setFont(shared_font(11, bold=True))
+        layout.addWidget(self.name_label, 0, 1)
         
-        self.team_label = QLabel(player_data.get('team_name', ''))
-        player_info.addWidget(self.team_label)
-        layout.addLayout(player_info)
+        self.team_label = QLabel()
+        layout.addWidget(self.team_label, 1, 1)
         
-        # Add spacer
-        layout.addStretch()
-        
-        # Player stats (customizable depending on the view)
-        stats_layout = QHBoxLayout()
-        stats_layout.setSpacing(15)
+        # Spacer column between the player info and the stats
+        layout.setColumnStretch(2, 1)
         
         # Create stat fields (example - customize as needed)
-        for stat, label in [
-            ('rating', 'Rating'),
-            ('goals_total', 'Goals'),
-            ('assists', 'Assists'),
-            ('minutes_played', 'Minutes')
-        ]:
-            if stat in player_data:
-                stat_layout = QVBoxLayout()
-                stat_label = QLabel(label)
-                stat_label.setFont(QFont("Arial", 8))
-                stat_layout.addWidget(stat_label)
-                
-                value_label = QLabel(str(player_data.get(stat, '')))
-                value_label.setFont(QFont("Arial", 11, QFont.Bold))
-                value_label.setAlignment(Qt.AlignCenter)
-                stat_layout.addWidget(value_label)
-                
-                stats_layout.addLayout(stat_layout)
-        
-        layout.addLayout(stats_layout)
+        self.stat_labels = {}
+        for col, (stat, label) in enumerate(self.STAT_FIELDS, start=3):
+            stat_label = QLabel(label)
+            stat_label.setFont(shared_font(8))
+            layout.addWidget(stat_label, 0, col)
+            
+            value_label = QLabel()
+            value_label.setFont(shared_font(11, bold=True))
+            value_label.setAlignment(Qt.AlignCenter)
+            layout.addWidget(value_label, 1, col)
+            
+            self.stat_labels[stat] = (stat_label, value_label)
         
         # Make the row clickable
         self.setMouseTracking(True)
+        
+        # Fill in the player's details
+        self.set_data(player_data)
+    
+    def set_data(self, player_data):
+        """
+        Show another player's details in this row, reusing its widgets.
+        
+        Args:
+            player_data (dict): Player data with rank
+        """
+        # Store player ID
+        self.player_id = player_data.get('player_id')
+        
+        self.rank_label.setText(f"#{player_data.get('rank', '')}")
+        self.name_label.setText(player_data.get('name', 'Unknown Player'))
+        self.team_label.setText(player_data.get('team_name', ''))
+        
+        # Only show the stats present in the data
+        for stat, (stat_label, value_label) in self.stat_labels.items():
+            present = stat in player_data
+            if present:
+                value_label.setText(str(player_data.get(stat, '')))
+            stat_label.setVisible(present)
+            value_label.setVisible(present)
     
     def mousePressEvent(self, event):
         """Handle mouse press events to emit player_clicked signal."""
@@ -171,6 +246,9 @@ class DashboardView(QWidget):
         """Initialize the dashboard view."""
         super().__init__(parent)
         
+        # Style sheet for all cards and player rows, parsed once
+        self.setStyleSheet(STATCARD_QSS + PLAYERROW_QSS)
+        
         # Create main layout
         self.main_layout = QVBoxLayout(self)
         
@@ -187,7 +265,7 @@ class DashboardView(QWidget):
         """Create the top stats section with cards."""
         # Section title
         stats_title = QLabel("League Statistics")
-        stats_title.setFont(QFont("Arial", 14, QFont.Bold))
+        stats_title.setFont(shared_font(14, bold=True))
         self.main_layout.addWidget(stats_title)
         
         # Stats cards grid
@@ -196,15 +274,17 @@ class DashboardView(QWidget):
         
         # Sample stats cards (will be populated with real data)
         stats = [
-            {"title": "Total Players", "value": "500", "subtitle": "Active in the league"},
-            {"title": "Average Goals", "value": "2.7", "subtitle": "Per match"},
-            {"title": "Top Scorer", "value": "Player Name", "subtitle": "15 goals"},
-            {"title": "Clean Sheets", "value": "45", "subtitle": "This season"}
+            {"key": "total_players", "title": "Total Players", "value": "500", "subtitle": "Active in the league"},
+            {"key": "average_goals", "title": "Average Goals", "value": "2.7", "subtitle": "Per match"},
+            {"key": "top_scorer", "title": "Top Scorer", "value": "Player Name", "subtitle": "15 goals"},
+            {"key": "clean_sheets", "title": "Clean Sheets", "value": "45", "subtitle": "This season"}
         ]
         
+        self.stat_cards = {}
         for i, stat in enumerate(stats):
             card = StatCard(stat["title"], stat["value"], stat["subtitle"])
             stats_grid.addWidget(card, i // 4, i % 4)
+            self.stat_cards[stat["key"]] = card
         
         self.main_layout.addLayout(stats_grid)
     
@@ -212,13 +292,21 @@ class DashboardView(QWidget):
         """Create the top players section with scrollable list."""
         # Section title
         players_title = QLabel("Top Players")
-        players_title.setFont(QFont("Arial", 14, QFont.Bold))
+        players_title.setFont(shared_font(14, bold=True))
         self.main_layout.addWidget(players_title)
         
         # Player list container
         self.players_container = QWidget()
         self.players_layout = QVBoxLayout(self.players_container)
         
+        # Player rows kept for reuse; rows beyond the current list are hidden
+        self._row_pool = []
+        
+        # Players of the current list (column name to values) and how many of them have rows
+        self._player_columns = {}
+        self._player_count = 0
+        self._rows_shown = 0
+        
         # Scrollable area for players
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
@@ -226,6 +314,10 @@ class DashboardView(QWidget):
         scroll_area.setFrameShape(QFrame.NoFrame)
         self.main_layout.addWidget(scroll_area)
         
+        # Add the next rows when the list is scrolled to the bottom
+        self.players_scrollbar = scroll_area.verticalScrollBar()
+        self.players_scrollbar.valueChanged.connect(self.on_players_scrolled)
+        
         # This will be populated with actual player data
         self.clear_players()
     
@@ -233,22 +325,43 @@ class DashboardView(QWidget):
         """Create the charts section with visualizations."""
         # Section title
         charts_title = QLabel("Visualizations")
-        charts_title.setFont(QFont("Arial", 14, QFont.Bold))
+        charts_title.setFont(shared_font(14, bold=True))
         self.main_layout.addWidget(charts_title)
         
-        # Charts grid
-        charts_layout = QHBoxLayout()
+        # Charts grid; the charts are built the first time the view is shown
+        self.charts_container = QWidget()
+        self.charts_layout = QHBoxLayout(self.charts_container)
+        self.charts_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_layout.addWidget(self.charts_container)
+        
+        self._charts_built = False
+        self._pending_chart_data = {}
+    
+    def showEvent(self, event):
+        """Build the charts after the view is first shown, so the rest paints first."""
+        super().showEvent(event)
+        if not self._charts_built:
+            QTimer.singleShot(0, self.build_charts)
+    
+    @Slot()
+    def build_charts(self):
+        """Create the chart widgets and apply any chart data received before."""
+        if self._charts_built:
+            return
+        self._charts_built = True
         
         # Add sample charts (will be replaced with actual data)
         # Position distribution pie chart
         self.position_chart = self.create_position_distribution_chart()
-        charts_layout.addWidget(self.position_chart)
+        self.charts_layout.addWidget(self.position_chart)
         
         # Goals per position bar chart
         self.goals_chart = self.create_goals_per_position_chart()
-        charts_layout.addWidget(self.goals_chart)
+        self.charts_layout.addWidget(self.goals_chart)
         
-        self.main_layout.addLayout(charts_layout)
+        pending, self._pending_chart_data = self._pending_chart_data, {}
+        if pending:
+            self.update_charts(pending)
     
     def create_position_distribution_chart(self):
         """Create a pie chart showing player position distribution."""
@@ -257,7 +370,7 @@ class DashboardView(QWidget):
         
         # Title
         title = QLabel("Position Distribution")
-        title.setFont(QFont("Arial", 12, QFont.Bold))
+        title.setFont(shared_font(12, bold=True))
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
@@ -279,60 +392,125 @@ class DashboardView(QWidget):
         
         # Title
         title = QLabel("Goals per Position")
-        title.setFont(QFont("Arial", 12, QFont.Bold))
+        title.setFont(shared_font(12, bold=True))
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
         # Simple bar chart with PyQtGraph
         plot = pg.PlotWidget()
         plot.setBackground('w')
+        if HAS_OPENGL:
+            plot.useOpenGL(True)
+        
+        # Static chart: no mouse zoom/pan, context menu or auto-ranging
+        plot.setMouseEnabled(x=False, y=False)
+        plot.setMenuEnabled(False)
+        plot.hideButtons()
+        plot.getViewBox().setMouseMode(pg.ViewBox.RectMode)
+        plot.getViewBox().disableAutoRange()
         
         # Will be updated with actual data
         # For now, just placeholder data
         positions = ["Defender", "Midfielder", "Forward"]
-        goals = [15, 45, 75]
-        x = range(len(positions))
+        goals = np.array([15, 45, 75], dtype=np.float32)
+        
+        # Bar positions and tick labels, reused until the positions change
+        self._pos_names = positions
+        self._pos_x = np.arange(len(positions), dtype=np.float32)
+        self._pos_ticks = [list(enumerate(positions))]
         
-        # Create a bar graph using BarGraphItem
-        bar_graph = pg.BarGraphItem(x=x, height=goals, width=0.6, brush='b')
-        plot.addItem(bar_graph)
+        # Create a bar graph using BarGraphItem, kept for in-place updates
+        self.goals_bar = pg.BarGraphItem(x=self._pos_x, height=goals, width=0.6, brush='b')
+        plot.addItem(self.goals_bar)
+        self.goals_bar_plot = plot
         
         # Set axis labels
         axis = plot.getAxis('bottom')
-        axis.setTicks([[(i, positions[i]) for i in range(len(positions))]])
+        axis.setTicks(self._pos_ticks)
+        
+        self.fit_goals_range(goals)
         
         layout.addWidget(plot)
         
         return chart_widget
     
     @Slot(object)
-    def update_top_players(self, players_df):
+    def update_top_players(self, player_columns):
         """
         Update the top players section with actual player data.
         
         Args:
-            players_df (pd.DataFrame): DataFrame with player data
+            player_columns (dict): Column name to a list or array of values, one per player,
+                for the columns in PLAYER_ROW_COLUMNS
         """
+        # Suspend repaints so the rows are laid out once, after all are added
+        self.players_container.setUpdatesEnabled(False)
+        
         self.clear_players()
         
-        for i, (_, player) in enumerate(players_df.iterrows()):
-            # Add rank to player data
-            player_data = player.to_dict()
+        self._player_columns = player_columns
+        self._player_count = len(next(iter(player_columns.values()), ()))
+        
+        # Only the first batch gets rows until the list is scrolled
+        self.show_more_players()
+        
+        self.players_layout.activate()
+        self.players_container.setUpdatesEnabled(True)
+    
+    def show_more_players(self):
+        """Show rows for the next batch of players in the current list."""
+        start = self._rows_shown
+        end = min(self._player_count, start + PLAYER_ROW_BATCH)
+        
+        for i in range(start, end):
+            # Gather the player's values and add the rank
+            player_data = {col: values[i] for col, values in self._player_columns.items()}
             player_data['rank'] = i + 1
             
-            # Create player row
-            player_row = PlayerRow(player_data)
-            player_row.player_clicked.connect(self.player_selected)
+            # Reuse a pooled row, creating one only when the pool is exhausted
+            if i < len(self._row_pool):
+                player_row = self._row_pool[i]
+                player_row.set_data(player_data)
+            else:
+                player_row = PlayerRow(player_data)
+                player_row.player_clicked.connect(self.player_selected)
+                self._row_pool.append(player_row)
+                self.players_layout.addWidget(player_row)
             
-            self.players_layout.addWidget(player_row)
+            player_row.setVisible(True)
+        
+        self._rows_shown = end
+    
+    @Slot(int)
+    def on_players_scrolled(self, value):
+        """
+        Add more player rows once the list is scrolled to the bottom.
+        
+        Args:
+            value (int): Scroll bar position
+        """
+        if value >= self.players_scrollbar.maximum() and self._rows_shown < self._player_count:
+            self.show_more_players()
     
     def clear_players(self):
         """Clear the players list."""
-        # Remove all existing player rows
-        while self.players_layout.count():
-            item = self.players_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Hide all existing player rows; they are reused by the next update
+        for player_row in self._row_pool:
+            player_row.setVisible(False)
+        self._rows_shown = 0
+    
+    @Slot(object)
+    def update_league_stats(self, stats):
+        """
+        Update the league statistics cards.
+        
+        Args:
+            stats (dict): Mapping of card key to (value, subtitle)
+        """
+        for key, (value, subtitle) in stats.items():
+            card = self.stat_cards.get(key)
+            if card is not None:
+                card.set_value(value, subtitle)
     
     @Slot(object)
     def update_charts(self, data):
@@ -342,6 +520,11 @@ class DashboardView(QWidget):
         Args:
             data (dict): Dictionary with chart data
         """
+        # Keep the latest data until the charts exist
+        if not self._charts_built:
+            self._pending_chart_data.update(data)
+            return
+        
         # Update position distribution chart
         if 'position_distribution' in data:
             positions = data['position_distribution']
@@ -350,4 +533,40 @@ class DashboardView(QWidget):
         # Update goals per position chart
         if 'goals_per_position' in data:
             goals_data = data['goals_per_position']
-            # Update the chart here...
\ No newline at end of file
+            self.update_goals_chart(list(goals_data), list(goals_data.values()))
+    
+    def update_goals_chart(self, positions, goals):
+        """
+        Update the goals per position bar chart in place.
+        
+        Args:
+            positions (list): Position names
+            goals (list): Goals for each position
+        """
+        heights = np.asarray(goals, dtype=np.float32)
+        
+        # Same positions as before: only the bar heights change
+        if positions == self._pos_names:
+            self.goals_bar.setOpts(height=heights)
+            self.fit_goals_range(heights)
+            return
+        
+        # Rebuild the x positions and tick labels for the new positions
+        self._pos_names = positions
+        if len(positions) != len(self._pos_x):
+            self._pos_x = np.arange(len(positions), dtype=np.float32)
+        self._pos_ticks = [list(enumerate(positions))]
+        
+        self.goals_bar.setOpts(x=self._pos_x, height=heights)
+        self.goals_bar_plot.getAxis('bottom').setTicks(self._pos_ticks)
+        self.fit_goals_range(heights)
+    
+    def fit_goals_range(self, heights):
+        """
+        Set the goals chart's view range to fit the bars, since auto-ranging is off.
+        
+        Args:
+            heights (np.ndarray): Bar heights
+        """
+        top = float(heights.max(initial=0)) * 1.1 or 1.0
+        self.goals_bar_plot.setRange(xRange=(-0.5, len(heights) - 0.5), yRange=(0, top), padding=0)
\ No newline at end of file
@@ -9,25 +9,262 @@ and statistics.
 """
 
 import os
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTabWidget,
     QPushButton, QTableView, QHeaderView, QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal, Slot, QSize
-from PySide6.QtGui import QFont, QPixmap, QStandardItemModel, QStandardItem
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QBuffer, QByteArray, QIODevice, QDir, QThreadPool
+from PySide6.QtGui import QFont, QPixmap
 
 import pyqtgraph as pg
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
 from PySide6.QtUiTools import QUiLoader
 
+from views.table_models import RowListModel
+from utils.workers import Worker
+
+# Detailed stats table rows as (label, player data key, is percentage)
+ATTACKING_STATS = (
+    ("Goals", 'goals_total', False),
+    ("Shots", 'shots_total', False),
+    ("Shots on Target", 'shots_on_target', False),
+    ("Shot Accuracy", 'shot_accuracy', True),
+    ("Shot Conversion", 'shot_conversion_rate', True),
+)
+
+PASSING_STATS = (
+    ("Passes", 'passes_total', False),
+    ("Pass Accuracy", 'passes_accuracy', True),
+    ("Key Passes", 'key_passes', False),
+    ("Assists", 'assists', False),
+)
+
+DEFENDING_STATS = (
+    ("Tackles", 'tackles_total', False),
+    ("Interceptions", 'tackles_interceptions', False),
+    ("Blocks", 'tackles_blocks', False),
+    ("Duels Won", 'duels_won', False),
+    ("Duels Success", 'duels_success_rate', True),
+)
+
+# Counting stats of the tables above, whose per 90 values are computed together
+PER90_KEYS = tuple(
+    key
+    for spec in (ATTACKING_STATS, PASSING_STATS, DEFENDING_STATS)
+    for _, key, is_pct in spec
+    if not is_pct
+)
+
+# Radar attributes by position as (labels, weights, source keys). Each value is
+# min(100, weight * source); 'constant' sources are 1, so the weight is a placeholder value.
+POSITION_SPECS = {
+    'Forward': (
+        ["Finishing", "Shot Power", "Speed", "Dribbling", "Passing", "Physical"],
+        np.array([1.2, 130, 85, 1.1, 1.0, 1.1], dtype=np.float32),
+        ('shot_conversion_rate', 'shots_on_ratio', 'constant', 'passes_accuracy', 'passes_accuracy', 'duels_success_rate'),
+    ),
+    'Midfielder': (
+        ["Passing", "Vision", "Ball Control", "Stamina", "Tackling", "Shooting"],
+        np.array([1.1, 10, 1.05, 90, 2, 1.1], dtype=np.float32),
+        ('passes_accuracy', 'assists', 'passes_accuracy', 'constant', 'tackles_total', 'shot_conversion_rate'),
+    ),
+    'Defender': (
+        ["Tackling", "Marking", "Heading", "Strength", "Positioning", "Passing"],
+        np.array([2, 3, 1.1, 1.05, 5, 1.0], dtype=np.float32),
+        ('tackles_total', 'tackles_interceptions', 'duels_success_rate', 'duels_success_rate', 'tackles_blocks', 'passes_accuracy'),
+    ),
+    'Goalkeeper': (
+        ["Reflexes", "Handling", "Positioning", "Kicking", "Speed", "Leadership"],
+        np.array([80, 75, 85, 70, 60, 80], dtype=np.float32),
+        ('constant',) * 6,
+    ),
+}
+
+# Player profile UI definition
+UI_FILE_PATH = os.path.join(os.path.dirname(__file__), 'ui', 'player_profile.ui')
+
+# UI loader shared by all player views, created on first use (GUI thread only)
+_ui_loader = None
+
+
+@lru_cache(maxsize=1)
+def player_profile_ui_bytes():
+    """
+    Read the player profile UI file once.
+    
+    Returns:
+        bytes: Contents of player_profile.ui
+    """
+    with open(UI_FILE_PATH, 'rb') as f:
+        return f.read()
+
+
+def load_player_profile_ui(parent):
+    """
+    Build the player profile UI from the cached UI file contents.
+    
+    Args:
+        parent (QWidget): Parent widget for the loaded UI
+    
+    Returns:
+        QWidget: Loaded UI
+    """
+    global _ui_loader
+    if _ui_loader is None:
+        _ui_loader = QUiLoader()
+        # Resolve relative resource paths (e.g., the placeholder photo) against the UI file
+        _ui_loader.setWorkingDirectory(QDir(os.path.dirname(UI_FILE_PATH)))
+    
+    buffer = QBuffer()
+    buffer.setData(QByteArray(player_profile_ui_bytes()))
+    buffer.open(QIODevice.ReadOnly)
+    try:
+        return _ui_loader.load(buffer, parent)
+    finally:
+        buffer.close()
+
+
+# Form history table columns, as match keys
+HISTORY_KEYS = ('date', 'opponent', 'result', 'minutes', 'rating', 'goals', 'assists')
+
+
+def history_rows(history):
+    """
+    Build form history table rows.
+    
+    Args:
+        history (list): Match dictionaries
+    
+    Returns:
+        list: Rows of strings in HISTORY_KEYS order
+    """
+    return [[str(match.get(key, '')) for key in HISTORY_KEYS] for match in history]
+
+
+def placeholder_history(generation, matches, base_rating, minutes_played, scores):
+    """
+    Generate placeholder form history and rating trend. Runs on a worker thread.
+    
+    Args:
+        generation (int): Form history update this data belongs to
+        matches (int): Number of matches
+        base_rating (float): Player's overall rating
+        minutes_played (int): Player's total minutes
+        scores (bool): Whether the player gets random goals and assists
+    
+    Returns:
+        tuple: (generation, form history table rows, match ratings)
+    """
+    # numpy generators are not thread-safe, so each call uses its own
+    rng = np.random.default_rng()
+    
+    # Values shared by every placeholder match
+    minutes = min(90, minutes_played // matches) if matches else 0
+    
+    # Draw all random values for the matches at once; ratings vary around the overall rating
+    ratings = np.clip(base_rating + (rng.random(matches) - 0.5), 5.0, 9.0)
+    results = rng.choice(['W', 'D', 'L'], size=matches, p=[0.5, 0.3, 0.2])
+    if scores:
+        goals = rng.integers(0, 2, size=matches)
+        assists = rng.integers(0, 2, size=matches)
+    else:
+        goals = assists = np.zeros(matches, dtype=np.int64)
+    
+    history = []
+    for i in range(matches):
+        match = {
+            'date': f"2023-{10-i:02d}-{(30-i)%31:02d}",
+            'opponent': f"Opponent {i+1}",
+            'result': results[i],
+            'minutes': minutes,
+            'rating': f"{ratings[i]:.1f}",
+            'goals': goals[i],
+            'assists': assists[i],
+        }
+        history.append(match)
+    
+    return generation, history_rows(history), ratings
+
 
-class RadarChart(FigureCanvas):
+def radar_position(position):
     """
-    Matplotlib-based radar chart for visualizing player attributes.
+    Map a player position to its POSITION_SPECS key.
+    
+    Args:
+        position (str): Player position
+    
+    Returns:
+        str: 'Forward', 'Midfielder', 'Defender', or 'Goalkeeper' for anything else
+    """
+    for key in ('Forward', 'Midfielder', 'Defender'):
+        if key in position:
+            return key
+    return 'Goalkeeper'
+
+
+def radar_values(weights, sources):
+    """
+    Scale radar source values by their weights, capped at 100.
+    
+    Args:
+        weights (np.ndarray): Weight per attribute
+        sources (np.ndarray): Source value per attribute
+    
+    Returns:
+        np.ndarray: Attribute values
+    """
+    return np.minimum(100.0, weights * sources)
+
+
+def per90_texts(player_data, per90_factor):
     """
+    Compute the per 90 values of all PER90_KEYS in one vectorized pass.
+    
+    Args:
+        player_data (dict): Player data dictionary
+        per90_factor (float): Factor converting totals to per 90 minutes
+    
+    Returns:
+        dict: Stat key to per 90 value formatted with two decimals
+    """
+    get = player_data.get
+    counts = np.fromiter((get(key, 0) for key in PER90_KEYS), dtype=np.float64, count=len(PER90_KEYS))
+    return dict(zip(PER90_KEYS, np.char.mod('%.2f', counts * per90_factor).tolist()))
+
+
+def build_stat_rows(spec, player_data, per90):
+    """
+    Build detailed stats table rows from a row spec.
+    
+    Args:
+        spec (tuple): (label, key, is percentage) row specs
+        player_data (dict): Player data dictionary
+        per90 (dict): Formatted per 90 values from per90_texts
+    
+    Returns:
+        list: (label, value, per 90 value) rows; percentages have no per 90 value
+    """
+    get = player_data.get
+    rows = []
+    for label, key, is_pct in spec:
+        value = get(key, 0)
+        if is_pct:
+            rows.append((label, f"{value:.1f}%", "-"))
+        else:
+            rows.append((label, value, per90[key]))
+    return rows
+
+
+class RadarChart(pg.PlotWidget):
+    """
+    PyQtGraph-based radar chart for visualizing player attributes.
+    """
+    
+    # Radial grid levels
+    GRID_LEVELS = (0.2, 0.4, 0.6, 0.8, 1.0)
     
     def __init__(self, labels, values, max_values=None, title=None, parent=None):
         """
@@ -40,15 +277,16 @@ class RadarChart(FigureCanvas):
             title (str, optional): Chart title. Defaults to None.
             parent (QWidget, optional): Parent widget. Defaults to None.
         """
-        # Create figure and add subplot
-        self.fig = plt.figure(figsize=(6, 6))
-        self.ax = self.fig.add_subplot(111, polar=True)
-        super().__init__(self.fig)
-        
-        self.setParent(parent)
+        super().__init__(parent)
         
-        # Scale the figure
-        self.fig.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.05)
+        # Static polar chart: no axes, no mouse interaction
+        self.setBackground('w')
+        self.hideAxis('left')
+        self.hideAxis('bottom')
+        self.setAspectLocked(True)
+        self.setMouseEnabled(x=False, y=False)
+        self.setMenuEnabled(False)
+        self.hideButtons()
         
         # Set properties
         self.labels = labels
@@ -56,58 +294,105 @@ class RadarChart(FigureCanvas):
         self.max_values = max_values or [100] * len(labels)
         self.title = title
         
-        # Draw the chart
-        self.draw_chart()
-    
-    def draw_chart(self):
-        """Draw the radar chart."""
-        # Clear the axes
-        self.ax.clear()
+        # Scaling divisors as an array, refreshed when max_values changes
+        self._max = np.asarray(self.max_values, dtype=np.float32)
         
-        # Number of variables
-        N = len(self.labels)
+        # Add title if provided
+        if self.title:
+            self.setTitle(self.title, size='15pt')
         
-        # Compute angle for each variable
-        angles = [n / float(N) * 2 * np.pi for n in range(N)]
-        angles += angles[:1]  # Close the loop
+        # Grid and label items, rebuilt only when the labels change
+        self._grid_items = []
+        self._drawn_labels = None
         
-        # Normalize values
-        normalized_values = [v / m for v, m in zip(self.values, self.max_values)]
-        normalized_values += normalized_values[:1]  # Close the loop
+        # Radar outline and its fill towards the center, updated in place
+        self.curve = pg.PlotCurveItem(pen=pg.mkPen('#3498db', width=2))
+        self._center = pg.PlotCurveItem(x=np.zeros(2), y=np.zeros(2), pen=pg.mkPen(None))
+        self.fill = pg.FillBetweenItem(self.curve, self._center, brush=pg.mkBrush(52, 152, 219, 77))
+        self.addItem(self.fill)
+        self.addItem(self.curve)
         
         # Draw the chart
-        self.ax.plot(angles, normalized_values, linewidth=2, linestyle='solid', color='#3498db')
-        self.ax.fill(angles, normalized_values, alpha=0.3, color='#3498db')
+        self.draw_chart()
+    
+    def draw_grid(self):
+        """Draw the radial grid, the spokes and the attribute labels."""
+        # Remove the previous grid
+        for item in self._grid_items:
+            self.removeItem(item)
+        self._grid_items = []
+        
+        grid_pen = pg.mkPen((200, 200, 200), width=1)
+        
+        # Concentric circles with percentage labels
+        circle = np.linspace(0, 2 * np.pi, 100)
+        for level in self.GRID_LEVELS:
+            self._grid_items.append(pg.PlotCurveItem(level * np.cos(circle), level * np.sin(circle), pen=grid_pen))
+            
+            level_label = pg.TextItem(f"{level * 100:.0f}%", color=(120, 120, 120), anchor=(0, 1))
+            level_label.setPos(0, level)
+            self._grid_items.append(level_label)
         
-        # Add labels
-        self.ax.set_xticks(angles[:-1])
-        self.ax.set_xticklabels(self.labels)
+        # Closed-loop angles and their cosines/sines, reused by every draw_chart
+        N = len(self.labels)
+        angles = np.linspace(0, 2 * np.pi, N, endpoint=False)
+        self._angles_closed = np.concatenate([angles, [0.0]])
+        self._cos_closed = np.cos(self._angles_closed)
+        self._sin_closed = np.sin(self._angles_closed)
+        
+        # Spokes and labels for each attribute
+        for angle, label in zip(angles, self.labels):
+            self._grid_items.append(pg.PlotCurveItem([0, np.cos(angle)], [0, np.sin(angle)], pen=grid_pen))
+            
+            text = pg.TextItem(str(label), color='k', anchor=(0.5, 0.5))
+            text.setPos(1.15 * np.cos(angle), 1.15 * np.sin(angle))
+            self._grid_items.append(text)
         
-        # Set y-ticks
-        self.ax.set_yticks([0.2, 0.4, 0.6, 0.8, 1.0])
-        self.ax.set_yticklabels(['20%', '40%', '60%', '80%', '100%'])
+        # Grid goes below the radar
+        for item in self._grid_items:
+            item.setZValue(-1)
+            self.addItem(item)
         
-        # Add grid
-        self.ax.grid(True)
+        self._drawn_labels = list(self.labels)
+        self.setRange(xRange=(-1.35, 1.35), yRange=(-1.35, 1.35), padding=0)
+    
+    def draw_chart(self):
+        """Draw the radar chart."""
+        # Rebuild the grid only for a new set of attributes
+        if self._drawn_labels != list(self.labels):
+            self.draw_grid()
         
-        # Add title if provided
-        if self.title:
-            self.ax.set_title(self.title, pad=20, fontsize=15)
+        # Normalize values
+        normalized_values = np.asarray(self.values, dtype=np.float32) / self._max
+        normalized_values = np.concatenate([normalized_values, normalized_values[:1]])  # Close the loop
         
-        # Redraw
-        self.fig.canvas.draw()
+        # Update the outline; the fill follows it
+        self.curve.setData(normalized_values * self._cos_closed, normalized_values * self._sin_closed)
     
-    def update_values(self, values, max_values=None):
+    def update_values(self, values, max_values=None, labels=None):
         """
         Update the chart with new values.
         
         Args:
             values (list): New attribute values
             max_values (list, optional): New maximum values for scaling. Defaults to None.
+            labels (list, optional): New attribute names. Defaults to None.
         """
+        # Nothing to redraw if the chart already shows exactly this data
+        unchanged = (
+            list(values) == list(self.values)
+            and (not max_values or list(max_values) == list(self.max_values))
+            and (labels is None or list(labels) == self._drawn_labels)
+        )
+        if unchanged:
+            return
+        
         self.values = values
         if max_values:
             self.max_values = max_values
+            self._max = np.asarray(max_values, dtype=np.float32)
+        if labels is not None:
+            self.labels = labels
         self.draw_chart()
 
 
@@ -141,7 +426,16 @@ class LineChartWidget(pg.PlotWidget):
             color (tuple, optional): RGB color tuple. Defaults to None.
         """
         pen = pg.mkPen(color=color or (30, 144, 255), width=2)
-        self.plot(x_data, y_data, name=name, pen=pen, symbol='o', symbolSize=6)
+        
+        # Long series are drawn at about one point per pixel: pyqtgraph downsamples
+        # the visible range (keeping each bin's peaks) and redoes it on zoom
+        if len(x_data) > 2 * max(1, self.width()):
+            self.plot(
+                x_data, y_data, name=name, pen=pen,
+                autoDownsample=True, downsampleMethod='peak', clipToView=True
+            )
+        else:
+            self.plot(x_data, y_data, name=name, pen=pen, symbol='o', symbolSize=6)
 
 
 class PlayerView(QDialog):
@@ -156,15 +450,13 @@ class PlayerView(QDialog):
         Initialize the player view.
         
         Args:
-            player_data (dict, optional): Player data dictionary. Defaults to None.
+            player_data (dict or pd.Series, optional): Player data mapping. Defaults to None.
             parent (QWidget, optional): Parent widget. Defaults to None.
         """
         super().__init__(parent)
         
-        # Load UI from file
-        loader = QUiLoader()
-        ui_file_path = os.path.join(os.path.dirname(__file__), 'ui', 'player_profile.ui')
-        self.ui = loader.load(ui_file_path, self)
+        # Load UI (the file is read once and reused by every player view)
+        self.ui = load_player_profile_ui(self)
         
         # Set window properties
         self.setWindowTitle("Player Profile")
@@ -178,6 +470,12 @@ class PlayerView(QDialog):
         # Connect signals
         self.ui.pushButton_find_similar.clicked.connect(self.on_find_similar_clicked)
         
+        # POSITION_SPECS key of the displayed player, classified once per update
+        self._position_key = 'Goalkeeper'
+        
+        # Incremented per form history update so results of superseded workers are dropped
+        self._history_generation = 0
+        
         # Initialize charts
         self.initialize_charts()
         
@@ -185,7 +483,7 @@ class PlayerView(QDialog):
         self.setup_tables()
         
         # Update UI if player data is provided
-        if player_data:
+        if player_data is not None:
             self.update_player_data(player_data)
     
     def initialize_charts(self):
@@ -212,7 +510,21 @@ class PlayerView(QDialog):
         self.setup_detailed_charts()
     
     def setup_detailed_charts(self):
-        """Set up charts for detailed statistics tabs."""
+        """Set up charts for detailed statistics tabs; they are built when the tab is first opened."""
+        self.attacking_chart = None
+        self.passing_chart = None
+        self.defending_chart = None
+        
+        # Data for charts whose tab was hidden when it arrived, by chart name
+        self._pending_chart_data = {}
+        
+        self.ui.tabWidget.currentChanged.connect(self.on_tab_changed)
+    
+    def build_detailed_charts(self):
+        """Create the detailed statistics charts, once."""
+        if self.attacking_chart is not None:
+            return
+        
         # Attacking chart
         attacking_layout = QVBoxLayout(self.ui.widget_attacking_chart)
         attacking_layout.setContentsMargins(0, 0, 0, 0)
@@ -221,6 +533,18 @@ class PlayerView(QDialog):
         self.attacking_chart.setBackground('w')
         attacking_layout.addWidget(self.attacking_chart)
         
+        # Shots and goals bars, updated in place by update_detailed_charts
+        self._shots_bar = pg.BarGraphItem(x=[], height=[], width=0.35, brush=(70, 130, 180))
+        self._goals_bar = pg.BarGraphItem(x=[], height=[], width=0.35, brush=(255, 99, 71))
+        self.attacking_chart.addItem(self._shots_bar)
+        self.attacking_chart.addItem(self._goals_bar)
+        
+        # Add legend manually
+        legend = pg.LegendItem()
+        legend.setParentItem(self.attacking_chart.graphicsItem())
+        legend.addItem(pg.PlotDataItem(pen=pg.mkPen(color=(70, 130, 180), width=10)), 'Shots')
+        legend.addItem(pg.PlotDataItem(pen=pg.mkPen(color=(255, 99, 71), width=10)), 'Goals')
+        
         # Passing chart
         passing_layout = QVBoxLayout(self.ui.widget_passing_chart)
         passing_layout.setContentsMargins(0, 0, 0, 0)
@@ -237,71 +561,117 @@ class PlayerView(QDialog):
         self.defending_chart.setBackground('w')
         defending_layout.addWidget(self.defending_chart)
     
+    def chart_tab(self, chart):
+        """
+        Get the tab page showing a chart.
+        
+        Args:
+            chart (str): 'detailed' or 'trend'
+        
+        Returns:
+            QWidget: Tab page of the main tab widget
+        """
+        return self.ui.tab_detailed_stats if chart == 'detailed' else self.ui.tab_form
+    
+    def refresh_chart(self, chart, chart_data):
+        """
+        Update a chart now if its tab is visible, otherwise when the tab is opened.
+        
+        Args:
+            chart (str): 'detailed' or 'trend'
+            chart_data (object): Player data dictionary for 'detailed', match ratings for 'trend'
+        """
+        if self.ui.tabWidget.currentWidget() is not self.chart_tab(chart):
+            self._pending_chart_data[chart] = chart_data
+            return
+        
+        self._pending_chart_data.pop(chart, None)
+        if chart == 'detailed':
+            self.update_detailed_charts(chart_data)
+        else:
+            self.update_trend_chart(chart_data)
+    
+    @Slot(int)
+    def on_tab_changed(self, index):
+        """
+        Run the chart updates that were deferred while the opened tab was hidden.
+        
+        Args:
+            index (int): Index of the newly selected tab
+        """
+        page = self.ui.tabWidget.widget(index)
+        for chart, chart_data in list(self._pending_chart_data.items()):
+            if page is self.chart_tab(chart):
+                self.refresh_chart(chart, chart_data)
+    
     def setup_tables(self):
         """Set up data models for tables."""
         # Attacking stats table
-        self.attacking_model = QStandardItemModel()
-        self.attacking_model.setHorizontalHeaderLabels(["Statistic", "Value", "Per 90"])
+        self.attacking_model = RowListModel(["Statistic", "Value", "Per 90"])
         self.ui.tableView_attacking.setModel(self.attacking_model)
         self.ui.tableView_attacking.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.ui.tableView_attacking.setEditTriggers(QAbstractItemView.NoEditTriggers)
         
         # Passing stats table
-        self.passing_model = QStandardItemModel()
-        self.passing_model.setHorizontalHeaderLabels(["Statistic", "Value", "Per 90"])
+        self.passing_model = RowListModel(["Statistic", "Value", "Per 90"])
         self.ui.tableView_passing.setModel(self.passing_model)
         self.ui.tableView_passing.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.ui.tableView_passing.setEditTriggers(QAbstractItemView.NoEditTriggers)
         
         # Defending stats table
-        self.defending_model = QStandardItemModel()
-        self.defending_model.setHorizontalHeaderLabels(["Statistic", "Value", "Per 90"])
+        self.defending_model = RowListModel(["Statistic", "Value", "Per 90"])
         self.ui.tableView_defending.setModel(self.defending_model)
         self.ui.tableView_defending.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.ui.tableView_defending.setEditTriggers(QAbstractItemView.NoEditTriggers)
         
         # Form history table
-        self.history_model = QStandardItemModel()
-        self.history_model.setHorizontalHeaderLabels(["Date", "Opponent", "Result", "Minutes", "Rating", "Goals", "Assists"])
+        self.history_model = RowListModel(["Date", "Opponent", "Result", "Minutes", "Rating", "Goals", "Assists"])
         self.ui.tableView_history.setModel(self.history_model)
         self.ui.tableView_history.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.ui.tableView_history.setEditTriggers(QAbstractItemView.NoEditTriggers)
     
-    @Slot(dict)
+    @Slot(object)
     def update_player_data(self, player_data):
         """
         Update the player profile with new data.
         
         Args:
-            player_data (dict): Player data dictionary
+            player_data (dict or pd.Series): Player data mapping; anything with .get() works
         """
-        if not player_data:
+        if player_data is None or len(player_data) == 0:
             return
         
+        # Copy into a plain dict once; the update methods below probe it many times
+        if not isinstance(player_data, dict):
+            player_data = dict(player_data.items())
+        get = player_data.get
+        
+        # Classify the position once for the radar and form history
+        self._position_key = radar_position(str(get('position', '') or ''))
+        
         # Update player info
-        self.player_id = player_data.get('player_id')
-        self.ui.label_player_name.setText(player_data.get('name', 'Unknown Player'))
-        self.ui.label_player_info.setText(f"{player_data.get('position', 'Unknown')}, {player_data.get('team_name', 'Unknown Team')}")
-        self.ui.label_player_nationality.setText(player_data.get('nationality', 'Unknown'))
+        self.player_id = get('player_id')
+        self.ui.label_player_name.setText(get('name', 'Unknown Player'))
+        self.ui.label_player_info.setText(f"{get('position', 'Unknown')}, {get('team_name', 'Unknown Team')}")
+        self.ui.label_player_nationality.setText(get('nationality', 'Unknown'))
         
         # Physical attributes
-        self.ui.label_player_age.setText(f"Age: {player_data.get('age', 'Unknown')}")
-        self.ui.label_player_height.setText(f"Height: {player_data.get('height', 'Unknown')}")
-        self.ui.label_player_weight.setText(f"Weight: {player_data.get('weight', 'Unknown')}")
+        self.ui.label_player_age.setText(f"Age: {get('age', 'Unknown')}")
+        self.ui.label_player_height.setText(f"Height: {get('height', 'Unknown')}")
+        self.ui.label_player_weight.setText(f"Weight: {get('weight', 'Unknown')}")
         
         # Rating
-        self.ui.label_player_rating.setText(str(player_data.get('rating', 'N/A')))
+        self.ui.label_player_rating.setText(str(get('rating', 'N/A')))
         
         # Update stats
         self.update_overview_stats(player_data)
         self.update_detailed_stats(player_data)
-        self.update_form_history(player_data)
         
         # Update radar chart
         self.update_radar_chart(player_data)
         
-        # Update trend chart
-        self.update_trend_chart(player_data)
+        # Update form history table and trend chart
+        self.update_form_history(player_data)
     
     def update_overview_stats(self, player_data):
         """
@@ -310,30 +680,32 @@ class PlayerView(QDialog):
         Args:
             player_data (dict): Player data dictionary
         """
+        get = player_data.get
+        
         # Update key stats
-        self.ui.label_appearances_value.setText(str(player_data.get('appearances', 'N/A')))
-        self.ui.label_minutes_value.setText(str(player_data.get('minutes_played', 'N/A')))
-        self.ui.label_goals_value.setText(str(player_data.get('goals_total', 'N/A')))
-        self.ui.label_assists_value.setText(str(player_data.get('assists', 'N/A')))
+        self.ui.label_appearances_value.setText(str(get('appearances', 'N/A')))
+        self.ui.label_minutes_value.setText(str(get('minutes_played', 'N/A')))
+        self.ui.label_goals_value.setText(str(get('goals_total', 'N/A')))
+        self.ui.label_assists_value.setText(str(get('assists', 'N/A')))
         
         # Shots
-        shots_total = player_data.get('shots_total', 0)
-        shots_on = player_data.get('shots_on_target', 0)
+        shots_total = get('shots_total', 0)
+        shots_on = get('shots_on_target', 0)
         self.ui.label_shots_value.setText(f"{shots_total} ({shots_on})")
         
         # Pass completion
-        pass_accuracy = player_data.get('passes_accuracy', 'N/A')
+        pass_accuracy = get('passes_accuracy', 'N/A')
         if pass_accuracy != 'N/A':
             self.ui.label_passes_value.setText(f"{pass_accuracy}%")
         else:
             self.ui.label_passes_value.setText("N/A")
         
         # Tackles
-        self.ui.label_tackles_value.setText(str(player_data.get('tackles_total', 'N/A')))
+        self.ui.label_tackles_value.setText(str(get('tackles_total', 'N/A')))
         
         # Duels
-        duels_total = player_data.get('duels_total', 0)
-        duels_won = player_data.get('duels_won', 0)
+        duels_total = get('duels_total', 0)
+        duels_won = get('duels_won', 0)
         if duels_total > 0:
             duels_success = (duels_won / duels_total) * 100
             self.ui.label_duels_value.setText(f"{duels_success:.1f}%")
@@ -347,115 +719,75 @@ class PlayerView(QDialog):
         Args:
             player_data (dict): Player data dictionary
         """
-        # Clear existing data
-        self.attacking_model.setRowCount(0)
-        self.passing_model.setRowCount(0)
-        self.defending_model.setRowCount(0)
-        
         # Minutes per 90 calculation
         minutes = player_data.get('minutes_played', 0)
         per90_factor = 90 / minutes if minutes > 0 else 0
+        per90 = per90_texts(player_data, per90_factor)
         
-        # Attacking stats
-        attacking_stats = [
-            ("Goals", player_data.get('goals_total', 0), player_data.get('goals_total', 0) * per90_factor),
-            ("Shots", player_data.get('shots_total', 0), player_data.get('shots_total', 0) * per90_factor),
-            ("Shots on Target", player_data.get('shots_on_target', 0), player_data.get('shots_on_target', 0) * per90_factor),
-            ("Shot Accuracy", f"{player_data.get('shot_accuracy', 0):.1f}%", "-"),
-            ("Shot Conversion", f"{player_data.get('shot_conversion_rate', 0):.1f}%", "-"),
-        ]
-        
-        for stat in attacking_stats:
-            self.add_table_row(self.attacking_model, stat)
-        
-        # Passing stats
-        passing_stats = [
-            ("Passes", player_data.get('passes_total', 0), player_data.get('passes_total', 0) * per90_factor),
-            ("Pass Accuracy", f"{player_data.get('passes_accuracy', 0):.1f}%", "-"),
-            ("Key Passes", player_data.get('key_passes', 0), player_data.get('key_passes', 0) * per90_factor),
-            ("Assists", player_data.get('assists', 0), player_data.get('assists', 0) * per90_factor),
-        ]
+        # Attacking, passing and defending stats, one data lookup per row
+        self.attacking_model.set_rows(build_stat_rows(ATTACKING_STATS, player_data, per90))
+        self.passing_model.set_rows(build_stat_rows(PASSING_STATS, player_data, per90))
+        self.defending_model.set_rows(build_stat_rows(DEFENDING_STATS, player_data, per90))
         
-        for stat in passing_stats:
-            self.add_table_row(self.passing_model, stat)
+        # Update charts (deferred while their tab is hidden)
+        self.refresh_chart('detailed', player_data)
+    
+    def update_form_history(self, player_data):
+        """
+        Update the form history table and trend chart.
         
-        # Defending stats
-        defending_stats = [
-            ("Tackles", player_data.get('tackles_total', 0), player_data.get('tackles_total', 0) * per90_factor),
-            ("Interceptions", player_data.get('tackles_interceptions', 0), player_data.get('tackles_interceptions', 0) * per90_factor),
-            ("Blocks", player_data.get('tackles_blocks', 0), player_data.get('tackles_blocks', 0) * per90_factor),
-            ("Duels Won", player_data.get('duels_won', 0), player_data.get('duels_won', 0) * per90_factor),
-            ("Duels Success", f"{player_data.get('duels_success_rate', 0):.1f}%", "-"),
-        ]
+        Args:
+            player_data (dict): Player data dictionary
+        """
+        # Form history data (this would typically come from an API call or nested data)
+        get = player_data.get
+        history = get('history', [])
+        self._history_generation += 1
         
-        for stat in defending_stats:
-            self.add_table_row(self.defending_model, stat)
+        if history:
+            # Parsing actual history into a rating trend is not implemented yet
+            self.show_form_history((self._history_generation, history_rows(history), None))
+            return
         
-        # Update charts
-        self.update_detailed_charts(player_data)
+        # For demonstration, generate placeholder data on a worker thread
+        worker = Worker(
+            placeholder_history,
+            self._history_generation,
+            min(get('appearances', 5), 10),  # Limit to 10 matches
+            float(get('rating', 7.0)),
+            get('minutes_played', 90),
+            self._position_key in ('Forward', 'Midfielder')
+        )
+        worker.signals.finished.connect(self.show_form_history)
+        worker.signals.error.connect(self.on_form_history_error)
+        QThreadPool.globalInstance().start(worker)
     
-    def add_table_row(self, model, data):
+    @Slot(object)
+    def show_form_history(self, result):
         """
-        Add a row to a table model.
+        Show form history table rows and the rating trend.
         
         Args:
-            model (QStandardItemModel): Table model
-            data (tuple): Row data (stat name, value, per 90 value)
+            result (tuple): (generation, table rows, match ratings or None)
         """
-        row = []
-        for item in data:
-            if isinstance(item, float):
-                row.append(QStandardItem(f"{item:.2f}"))
-            else:
-                row.append(QStandardItem(str(item)))
+        generation, rows, ratings = result
+        if generation != self._history_generation:
+            return
+        
+        self.history_model.set_rows(rows)
         
-        model.appendRow(row)
+        # Update trend chart (deferred while its tab is hidden)
+        self.refresh_chart('trend', ratings)
     
-    def update_form_history(self, player_data):
+    @Slot(str)
+    def on_form_history_error(self, message):
         """
-        Update the form history table.
+        Handle a failure while generating the form history.
         
         Args:
-            player_data (dict): Player data dictionary
+            message (str): Error message
         """
-        # Clear existing data
-        self.history_model.setRowCount(0)
-        
-        # Form history data (this would typically come from an API call or nested data)
-        # For demonstration, we'll create some sample data
-        history = player_data.get('history', [])
-        
-        if not history:
-            # Generate some placeholder data if not available
-            matches = min(player_data.get('appearances', 5), 10)  # Limit to 10 matches
-            history = []
-            
-            for i in range(matches):
-                rating = max(5.0, min(9.0, float(player_data.get('rating', 7.0)) + (np.random.random() - 0.5)))
-                
-                match = {
-                    'date': f"2023-{10-i:02d}-{(30-i)%31:02d}",
-                    'opponent': f"Opponent {i+1}",
-                    'result': np.random.choice(['W', 'D', 'L'], p=[0.5, 0.3, 0.2]),
-                    'minutes': min(90, player_data.get('minutes_played', 90) // matches),
-                    'rating': f"{rating:.1f}",
-                    'goals': np.random.randint(0, 2) if player_data.get('position') in ['Forward', 'Midfielder'] else 0,
-                    'assists': np.random.randint(0, 2) if player_data.get('position') in ['Forward', 'Midfielder'] else 0,
-                }
-                history.append(match)
-        
-        # Add data to table
-        for match in history:
-            row = [
-                QStandardItem(str(match.get('date', ''))),
-                QStandardItem(str(match.get('opponent', ''))),
-                QStandardItem(str(match.get('result', ''))),
-                QStandardItem(str(match.get('minutes', ''))),
-                QStandardItem(str(match.get('rating', ''))),
-                QStandardItem(str(match.get('goals', ''))),
-                QStandardItem(str(match.get('assists', ''))),
-            ]
-            self.history_model.appendRow(row)
+        print(f"Error generating form history: {message}")
     
     def update_radar_chart(self, player_data):
         """
@@ -464,85 +796,47 @@ class PlayerView(QDialog):
         Args:
             player_data (dict): Player data dictionary
         """
-        # Define attributes based on position
-        position = player_data.get('position', '')
-        
-        if 'Forward' in position:
-            labels = ["Finishing", "Shot Power", "Speed", "Dribbling", "Passing", "Physical"]
-            values = [
-                player_data.get('shot_conversion_rate', 0) * 1.2,  # Finishing
-                min(100, player_data.get('shots_on_target', 0) / max(1, player_data.get('shots_total', 1)) * 130),  # Shot Power
-                85,  # Speed (placeholder)
-                min(100, player_data.get('passes_accuracy', 0) * 1.1),  # Dribbling (using pass accuracy as proxy)
-                min(100, player_data.get('passes_accuracy', 0)),  # Passing
-                min(100, player_data.get('duels_success_rate', 0) * 1.1),  # Physical
-            ]
-        
-        elif 'Midfielder' in position:
-            labels = ["Passing", "Vision", "Ball Control", "Stamina", "Tackling", "Shooting"]
-            values = [
-                min(100, player_data.get('passes_accuracy', 0) * 1.1),  # Passing
-                min(100, player_data.get('assists', 0) * 10),  # Vision
-                min(100, player_data.get('passes_accuracy', 0) * 1.05),  # Ball Control
-                90,  # Stamina (placeholder)
-                min(100, player_data.get('tackles_total', 0) * 2),  # Tackling
-                min(100, player_data.get('shot_conversion_rate', 0) * 1.1),  # Shooting
-            ]
-        
-        elif 'Defender' in position:
-            labels = ["Tackling", "Marking", "Heading", "Strength", "Positioning", "Passing"]
-            values = [
-                min(100, player_data.get('tackles_total', 0) * 2),  # Tackling
-                min(100, player_data.get('tackles_interceptions', 0) * 3),  # Marking
-                min(100, player_data.get('duels_success_rate', 0) * 1.1),  # Heading
-                min(100, player_data.get('duels_success_rate', 0) * 1.05),  # Strength
-                min(100, player_data.get('tackles_blocks', 0) * 5),  # Positioning
-                min(100, player_data.get('passes_accuracy', 0)),  # Passing
-            ]
-        
-        else:  # Default or Goalkeeper
-            labels = ["Reflexes", "Handling", "Positioning", "Kicking", "Speed", "Leadership"]
-            values = [80, 75, 85, 70, 60, 80]  # Placeholder values
+        # Attribute spec for the player's position
+        get = player_data.get
+        labels, weights, keys = POSITION_SPECS[self._position_key]
+        
+        # Derived sources, then one lookup per attribute
+        derived = {
+            'constant': 1.0,
+            'shots_on_ratio': get('shots_on_target', 0) / max(1, get('shots_total', 1)),
+        }
+        sources = np.array(
+            [derived[key] if key in derived else get(key, 0) for key in keys],
+            dtype=np.float32
+        )
+        values = radar_values(weights, sources)
         
         # Update the radar chart
         if hasattr(self, 'radar_chart'):
-            self.radar_chart.labels = labels
-            self.radar_chart.update_values(values)
+            self.radar_chart.update_values(values, labels=labels)
     
-    def update_trend_chart(self, player_data):
+    def update_trend_chart(self, ratings):
         """
         Update the trend chart with player form history.
         
         Args:
-            player_data (dict): Player data dictionary
+            ratings (np.ndarray): Rating per match, or None if there is no trend to show
         """
         # Clear existing plots
         self.trend_chart.clear()
         
-        # Form history data
-        history = player_data.get('history', [])
+        if ratings is None:
+            return
         
-        if not history:
-            # Generate some placeholder data if not available
-            matches = min(player_data.get('appearances', 5), 10)  # Limit to 10 matches
-            
-            # X-axis: match numbers
-            x_data = list(range(1, matches + 1))
-            
-            # Rating trend: slightly random around the player's overall rating
-            base_rating = float(player_data.get('rating', 7.0))
-            rating_trend = [max(5.0, min(9.0, base_rating + (np.random.random() - 0.5))) for _ in range(matches)]
-            
-            # Plot the trend
-            self.trend_chart.plot_trend(x_data, rating_trend, name="Rating", color=(52, 152, 219))
-            
-            # Set axis labels
-            self.trend_chart.setLabel('left', 'Rating')
-            self.trend_chart.setLabel('bottom', 'Match')
-        else:
-            # Use actual history data
-            # This would require parsing the history data correctly
-            pass
+        # X-axis: match numbers
+        x_data = list(range(1, len(ratings) + 1))
+        
+        # Plot the trend
+        self.trend_chart.plot_trend(x_data, ratings, name="Rating", color=(52, 152, 219))
+        
+        # Set axis labels
+        self.trend_chart.setLabel('left', 'Rating')
+        self.trend_chart.setLabel('bottom', 'Match')
     
     def update_detailed_charts(self, player_data):
         """
@@ -551,9 +845,10 @@ class PlayerView(QDialog):
         Args:
             player_data (dict): Player data dictionary
         """
-        # Attacking chart (e.g., shots and goals distribution)
-        self.attacking_chart.clear()
+        # Create the charts on first use
+        self.build_detailed_charts()
         
+        # Attacking chart (e.g., shots and goals distribution)
         # Placeholder data for demonstration
         categories = ['Inside Box', 'Outside Box', 'Headers', 'Free Kicks', 'Penalties']
         goals = [3, 1, 1, 0, 0]  # Placeholder
@@ -563,17 +858,8 @@ class PlayerView(QDialog):
         x = np.arange(len(categories))
         bar_width = 0.35
         
-        shots_bar = pg.BarGraphItem(x=x - bar_width/2, height=shots, width=bar_width, brush=(70, 130, 180))
-        goals_bar = pg.BarGraphItem(x=x + bar_width/2, height=goals, width=bar_width, brush=(255, 99, 71))
-        
-        self.attacking_chart.addItem(shots_bar)
-        self.attacking_chart.addItem(goals_bar)
-        
-        # Add legend manually
-        legend = pg.LegendItem()
-        legend.setParentItem(self.attacking_chart.graphicsItem())
-        legend.addItem(pg.PlotDataItem(pen=pg.mkPen(color=(70, 130, 180), width=10)), 'Shots')
-        legend.addItem(pg.PlotDataItem(pen=pg.mkPen(color=(255, 99, 71), width=10)), 'Goals')
+        self._shots_bar.setOpts(x=x - bar_width/2, height=shots, width=bar_width)
+        self._goals_bar.setOpts(x=x + bar_width/2, height=goals, width=bar_width)
         
         # Similar approach for passing and defending charts
         # ...
@@ -8,13 +8,18 @@ This module implements a settings dialog for configuring application settings.
 """
 
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-    QComboBox, QFormLayout, QPushButton, QGroupBox, QDialogButtonBox,
-    QSpinBox, QCheckBox, QMessageBox
+    QDialog, QHBoxLayout, QLabel, QLineEdit, 
+    QComboBox, QFormLayout, QPushButton, QDialogButtonBox,
+    QCheckBox, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, Signal, Slot, QThreadPool, QSignalBlocker, QTimer
+from PySide6.QtGui import QIntValidator, QFont
 
-from utils.config import save_config, load_config, API_KEY, API_SOURCE
+from utils.config import (
+    save_config, load_config, API_KEY, API_SOURCE,
+    KEY_API_SOURCE, KEY_API_KEY, KEY_CACHE_EXPIRY, KEY_CURRENT_SEASON, SETTINGS_KEYS
+)
+from utils.workers import Worker
 
 
 class SettingsDialog(QDialog):
@@ -22,48 +27,115 @@ class SettingsDialog(QDialog):
     Dialog for configuring application settings.
     """
     
-    # Signal emitted when settings change
+    # Signal emitted when settings change, with only the changed settings
     settings_changed = Signal(dict)
     
-    def __init__(self, parent=None):
-        """Initialize the settings dialog."""
+    # API source choices as (label, config value)
+    API_SOURCES = (
+        ("RapidAPI", "rapidapi"),
+        ("API-Sports", "apisports"),
+        ("Mock Data (No API Key Required)", "mock"),
+    )
+    
+    # Selectable seasons
+    SEASON_MIN = 2010
+    SEASON_MAX = 2030
+    
+    # Delay after the API key or source is edited before the key is checked
+    KEY_VALIDATION_DELAY_MS = 500
+    
+    # Combo box index of each API source value
+    API_SOURCE_INDEX = {source: index for index, (_, source) in enumerate(API_SOURCES)}
+    
+    def __init__(self, parent=None, clear_cache=None, validate_key=None):
+        """
+        Initialize the settings dialog.
+        
+        Args:
+            parent (QWidget, optional): Parent widget. Defaults to None.
+            clear_cache (callable, optional): Function clearing the API request cache,
+                run on a worker thread. Defaults to None.
+            validate_key (callable, optional): Function (api_source, api_key) -> bool checking
+                an API key, run on a worker thread. Defaults to None.
+        """
         super().__init__(parent)
         
-        # Load current settings
-        self.config = load_config()
+        self.clear_cache = clear_cache
+        self.validate_key = validate_key
+        
+        # Whether the user typed in the API key field since the settings were loaded
+        self._api_key_edited = False
+        
+        # Message boxes by title, created on first use and reused
+        self._message_boxes = {}
+        
+        # Latest API key check as ((api_source, api_key), accepted)
+        self._key_validation = None
+        
+        # Debounce timer for API key checks while the user edits the settings
+        self._key_validation_timer = QTimer(self)
+        self._key_validation_timer.setSingleShot(True)
+        self._key_validation_timer.setInterval(self.KEY_VALIDATION_DELAY_MS)
+        self._key_validation_timer.timeout.connect(self.probe_api_key)
+        
+        # Current settings, loaded each time the dialog is shown
+        self.config = {}
+        
+        # The widgets are created the first time the dialog is shown
+        self._built = False
         
         # Set up the dialog
         self.setWindowTitle("Settings")
         self.resize(500, 400)
         
+        # Native child widgets must not force native window handles on the dialog and its parents
+        self.setAttribute(Qt.WA_DontCreateNativeAncestors)
+    
+    def build(self):
+        """Create the dialog widgets, once; called on first show or ahead of time while idle."""
+        if self._built:
+            return
+        
         # Create the layout
         self.create_layout()
         
+        # Connect signals
+        self.connect_signals()
+        self._built = True
+    
+    def showEvent(self, event):
+        """Create the widgets on first show and fill them with the current settings."""
+        self.build()
+        
+        # Load current settings (a copy, so a cancelled dialog leaves the cached config untouched)
+        self.config = dict(load_config())
+        
         # Fill fields with current settings
         self.load_settings()
         
-        # Connect signals
-        self.connect_signals()
+        super().showEvent(event)
     
     def create_layout(self):
-        """Create the dialog layout."""
-        layout = QVBoxLayout(self)
+        """Create the dialog layout: one form, with a bold header row per section."""
+        layout = QFormLayout(self)
         
-        # API settings group
-        api_group = QGroupBox("API Settings")
-        api_layout = QFormLayout(api_group)
+        # Section header font, shared by all headers
+        self._section_font = QFont(self.font())
+        self._section_font.setBold(True)
+        
+        # API settings section
+        layout.addRow(self.section_label("API Settings"))
         
         # API source selection
         self.api_source_combo = QComboBox()
-        self.api_source_combo.addItem("RapidAPI", "rapidapi")
-        self.api_source_combo.addItem("API-Sports", "apisports")
-        self.api_source_combo.addItem("Mock Data (No API Key Required)", "mock")
-        api_layout.addRow("API Source:", self.api_source_combo)
+        for text, source in self.API_SOURCES:
+            self.api_source_combo.addItem(text, source)
+        layout.addRow("API Source:", self.api_source_combo)
         
         # API key field
         self.api_key_edit = QLineEdit()
         self.api_key_edit.setPlaceholderText("Enter your API key")
-        api_layout.addRow("API Key:", self.api_key_edit)
+        layout.addRow("API Key:", self.api_key_edit)
         
         # API info label
         self.api_info_label = QLabel(
@@ -71,58 +143,68 @@ class SettingsDialog(QDialog):
             "For API-Sports: https://v3.football.api-sports.io/"
         )
         self.api_info_label.setWordWrap(True)
-        api_layout.addRow("", self.api_info_label)
-        
-        layout.addWidget(api_group)
+        layout.addRow("", self.api_info_label)
         
-        # Cache settings group
-        cache_group = QGroupBox("Cache Settings")
-        cache_layout = QFormLayout(cache_group)
+        # Cache settings section
+        layout.addRow(self.section_label("Cache Settings"))
         
-        # Cache expiry spin box
-        self.cache_expiry_spin = QSpinBox()
-        self.cache_expiry_spin.setRange(1, 168)  # 1 hour to 7 days
-        self.cache_expiry_spin.setSuffix(" hours")
-        cache_layout.addRow("Cache Expiry:", self.cache_expiry_spin)
+        # Cache expiry field (a validated line edit is lighter than a spin box)
+        self.cache_expiry_edit = QLineEdit()
+        self.cache_expiry_edit.setValidator(QIntValidator(1, 168, self))  # 1 hour to 7 days
+        self.cache_expiry_edit.setPlaceholderText("1-168 hours")
+        layout.addRow("Cache Expiry (hours):", self.cache_expiry_edit)
         
         # Clear cache button
         self.clear_cache_button = QPushButton("Clear Cache")
-        cache_layout.addRow("", self.clear_cache_button)
+        layout.addRow("", self.clear_cache_button)
         
-        layout.addWidget(cache_group)
-        
-        # Season settings group
-        season_group = QGroupBox("Season Settings")
-        season_layout = QFormLayout(season_group)
+        # Season settings section
+        layout.addRow(self.section_label("Season Settings"))
         
         # Season selection
-        self.season_spin = QSpinBox()
-        self.season_spin.setRange(2010, 2030)
-        season_layout.addRow("Current Season:", self.season_spin)
-        
-        layout.addWidget(season_group)
+        self.season_edit = QLineEdit()
+        self.season_edit.setValidator(QIntValidator(self.SEASON_MIN, self.SEASON_MAX, self))
+        self.season_edit.setPlaceholderText(f"{self.SEASON_MIN}-{self.SEASON_MAX}")
+        layout.addRow("Current Season:", self.season_edit)
         
         # Buttons
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
-        layout.addWidget(button_box)
+        layout.addRow(button_box)
+    
+    def section_label(self, text):
+        """
+        Create a section header for the settings form.
+        
+        Args:
+            text (str): Section title
+        
+        Returns:
+            QLabel: Bold header label
+        """
+        label = QLabel(text)
+        label.setFont(self._section_font)
+        return label
     
     def load_settings(self):
         """Load current settings into the form fields."""
-        # API settings
-        api_source = self.config.get('api_source', 'mock')
-        index = self.api_source_combo.findData(api_source)
+        # API settings (without firing update_api_key_state; it runs once below)
+        api_source = self.config.get(KEY_API_SOURCE, 'mock')
+        index = self.API_SOURCE_INDEX.get(api_source, -1)
         if index >= 0:
-            self.api_source_combo.setCurrentIndex(index)
+            with QSignalBlocker(self.api_source_combo):
+                self.api_source_combo.setCurrentIndex(index)
         
-        self.api_key_edit.setText(self.config.get('api_key', ''))
+        self.api_key_edit.setText(self.config.get(KEY_API_KEY, ''))
+        self._api_key_edited = False
         
         # Cache settings
-        self.cache_expiry_spin.setValue(self.config.get('cache_expiry_hours', 24))
+        self.cache_expiry_edit.setText(str(self.config.get(KEY_CACHE_EXPIRY, 24)))
         
         # Season settings
-        self.season_spin.setValue(self.config.get('current_season', 2023))
+        season = self.config.get(KEY_CURRENT_SEASON, 2023)
+        self.season_edit.setText(str(max(self.SEASON_MIN, min(self.SEASON_MAX, season))))
         
         # Update API key field enabled state based on source
         self.update_api_key_state()
@@ -132,6 +214,13 @@ class SettingsDialog(QDialog):
         # API source changed
         self.api_source_combo.currentIndexChanged.connect(self.update_api_key_state)
         
+        # Check the API key in the background once the user stops editing it
+        self.api_source_combo.currentIndexChanged.connect(self.schedule_key_check)
+        self.api_key_edit.editingFinished.connect(self.schedule_key_check)
+        
+        # Track user edits of the API key, so an untouched key is not read back
+        self.api_key_edit.textEdited.connect(self.on_api_key_edited)
+        
         # Clear cache button
         self.clear_cache_button.clicked.connect(self.on_clear_cache)
     
@@ -142,42 +231,170 @@ class SettingsDialog(QDialog):
     
     def on_clear_cache(self):
         """Handle clear cache button click."""
-        # This would clear the API cache
-        # For now, just show a message
-        QMessageBox.information(
-            self,
+        if self.clear_cache is None:
+            self.on_cache_cleared(None)
+            return
+        
+        # Clear the cache on a worker thread; the button is re-enabled when it is done
+        self.clear_cache_button.setEnabled(False)
+        worker = Worker(self.clear_cache)
+        worker.signals.finished.connect(self.on_cache_cleared)
+        worker.signals.error.connect(self.on_clear_cache_error)
+        QThreadPool.globalInstance().start(worker)
+    
+    @Slot(object)
+    def on_cache_cleared(self, result):
+        """
+        Confirm that the cache was cleared.
+        
+        Args:
+            result (object): Return value of the clear function (unused)
+        """
+        self.clear_cache_button.setEnabled(True)
+        self.show_message(
+            QMessageBox.Information,
             "Cache Cleared",
             "The API request cache has been cleared."
         )
     
+    @Slot(str)
+    def on_clear_cache_error(self, message):
+        """
+        Report a failure while clearing the cache.
+        
+        Args:
+            message (str): Error message
+        """
+        self.clear_cache_button.setEnabled(True)
+        self.show_message(
+            QMessageBox.Warning,
+            "Clear Cache Failed",
+            f"The API request cache could not be cleared: {message}"
+        )
+    
+    @Slot(str)
+    def on_api_key_edited(self, text):
+        """
+        Remember that the user changed the API key.
+        
+        Args:
+            text (str): New field text (unused)
+        """
+        self._api_key_edited = True
+    
+    @Slot()
+    def schedule_key_check(self):
+        """Check the API key after a short delay, restarting the delay on every edit."""
+        self._key_validation_timer.start()
+    
+    @Slot()
+    def probe_api_key(self):
+        """Check the entered API key on a worker thread, unless its verdict is already known."""
+        api_source = self.api_source_combo.currentData()
+        api_key = self.api_key_edit.text().strip()
+        if self.validate_key is None or api_source == 'mock' or not api_key:
+            return
+        if self._key_validation is not None and self._key_validation[0] == (api_source, api_key):
+            return
+        
+        worker = Worker(self.check_api_key, api_source, api_key)
+        worker.signals.finished.connect(self.on_api_key_checked)
+        QThreadPool.globalInstance().start(worker)
+    
+    def check_api_key(self, api_source, api_key):
+        """
+        Check an API key. Runs on a worker thread.
+        
+        Args:
+            api_source (str): API source
+            api_key (str): API key
+        
+        Returns:
+            tuple: ((api_source, api_key), accepted)
+        """
+        return (api_source, api_key), self.validate_key(api_source, api_key)
+    
+    @Slot(object)
+    def on_api_key_checked(self, result):
+        """
+        Remember the result of a background API key check.
+        
+        Args:
+            result (tuple): ((api_source, api_key), accepted)
+        """
+        self._key_validation = result
+    
+    def show_message(self, icon, title, text):
+        """
+        Show a modal message box, reusing one instance per title.
+        
+        Args:
+            icon (QMessageBox.Icon): Message box icon
+            title (str): Window title
+            text (str): Message text
+        """
+        box = self._message_boxes.get(title)
+        if box is None:
+            box = QMessageBox(icon, title, text, QMessageBox.Ok, self)
+            self._message_boxes[title] = box
+        else:
+            box.setText(text)
+        box.exec()
+    
     def accept(self):
         """Save settings when the dialog is accepted."""
         # Get values from form fields
         api_source = self.api_source_combo.currentData()
-        api_key = self.api_key_edit.text().strip()
-        cache_expiry = self.cache_expiry_spin.value()
-        current_season = self.season_spin.value()
+        if self._api_key_edited:
+            api_key = self.api_key_edit.text().strip()
+        else:
+            api_key = self.config.get(KEY_API_KEY, '')
+        
+        # Check that the numeric fields are within their validators' ranges
+        if not self.cache_expiry_edit.hasAcceptableInput():
+            self.show_message(
+                QMessageBox.Warning,
+                "Invalid Cache Expiry",
+                "Please enter a cache expiry between 1 and 168 hours."
+            )
+            return
+        if not self.season_edit.hasAcceptableInput():
+            self.show_message(
+                QMessageBox.Warning,
+                "Invalid Season",
+                f"Please enter a season between {self.SEASON_MIN} and {self.SEASON_MAX}."
+            )
+            return
+        cache_expiry = int(self.cache_expiry_edit.text())
+        current_season = int(self.season_edit.text())
         
         # Check if API key is provided when needed
         if api_source != 'mock' and not api_key:
-            QMessageBox.warning(
-                self,
+            self.show_message(
+                QMessageBox.Warning,
                 "API Key Required",
                 "Please enter an API key when using RapidAPI or API-Sports."
             )
             return
         
-        # Update config
-        self.config['api_source'] = api_source
-        self.config['api_key'] = api_key
-        self.config['cache_expiry_hours'] = cache_expiry
-        self.config['current_season'] = current_season
+        # Use the background check's verdict if it is for this key; unknown keys are accepted
+        if self._key_validation == ((api_source, api_key), False):
+            self.show_message(
+                QMessageBox.Warning,
+                "Invalid API Key",
+                "The API rejected this key. Please check it and try again."
+            )
+            return
         
-        # Save config
-        save_config(self.config)
+        # Settings that differ from the ones the form was filled with
+        new_values = dict(zip(SETTINGS_KEYS, (api_source, api_key, cache_expiry, current_season)))
+        changes = {key: new_values[key] for key in SETTINGS_KEYS if self.config.get(key) != new_values[key]}
         
-        # Emit signal
-        self.settings_changed.emit(self.config)
+        # Save config and emit signal only if something changed
+        if changes:
+            self.config.update(changes)
+            save_config(self.config)
+            self.settings_changed.emit(changes)
         
         # Close dialog
         super().accept()
\ No newline at end of file
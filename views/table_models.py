@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Table Models Module
+
+This module implements Qt item models for displaying tabular data in
+table views without copying it into per-cell items.
+"""
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+class DataFrameModel(QAbstractTableModel):
+    """
+    Read-only table model backed directly by a pandas DataFrame.
+    
+    Cell values are looked up and formatted on demand, so only the cells
+    the view actually paints are ever touched.
+    """
+    
+    def __init__(self, df, columns=None, headers=None, formatters=None, defaults=None, parent=None):
+        """
+        Initialize the DataFrame model.
+        
+        Args:
+            df (pd.DataFrame): DataFrame to display
+            columns (list, optional): Columns to show, in order. Defaults to all columns.
+            headers (list, optional): Header labels for the columns. Defaults to the column names.
+            formatters (dict, optional): Column name to callable formatting a cell value. Defaults to None.
+            defaults (dict, optional): Column name to text shown when the column is missing. Defaults to None.
+            parent (QObject, optional): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        
+        self.df = df
+        self.columns = list(columns) if columns is not None else list(df.columns)
+        self.headers = list(headers) if headers is not None else [str(col) for col in self.columns]
+        self.formatters = formatters or {}
+        self.defaults = defaults or {}
+        
+        # Resolve column positions once so data() can use positional access
+        self._positions = [
+            df.columns.get_loc(col) if col in df.columns else None
+            for col in self.columns
+        ]
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of rows in the DataFrame."""
+        return 0 if parent.isValid() else len(self.df)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of displayed columns."""
+        return 0 if parent.isValid() else len(self.columns)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Return the display text for a cell.
+        
+        Args:
+            index (QModelIndex): Cell index
+            role (int, optional): Data role. Defaults to Qt.DisplayRole.
+        
+        Returns:
+            str: Cell text, or None for unsupported roles
+        """
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        
+        col = self.columns[index.column()]
+        position = self._positions[index.column()]
+        
+        if position is None:
+            return self.defaults.get(col, '')
+        
+        value = self.df.iat[index.row(), position]
+        formatter = self.formatters.get(col)
+        return formatter(value) if formatter else str(value)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return header labels for columns and 1-based row numbers."""
+        if role != Qt.DisplayRole:
+            return None
+        
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+        
+        return str(section + 1)
+
+
+
+class RowListModel(QAbstractTableModel):
+    """
+    Read-only table model backed by a list of row tuples.
+    
+    Suited to small tables rebuilt as a whole, such as per-player stats;
+    replacing the rows resets the model once instead of inserting row by row.
+    Cell text is formatted when the rows are set, not on every repaint.
+    """
+    
+    def __init__(self, headers, rows=None, parent=None):
+        """
+        Initialize the row list model.
+        
+        Args:
+            headers (list): Header labels for the columns
+            rows (list, optional): Row tuples, one value per column. Defaults to None.
+            parent (QObject, optional): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        
+        self.headers = list(headers)
+        self.rows = self.format_rows(rows) if rows is not None else []
+    
+    @staticmethod
+    def format_rows(rows):
+        """
+        Convert row values to display text; floats are shown with two decimals.
+        
+        Args:
+            rows (list): Row tuples, one value per column
+        
+        Returns:
+            list: Row tuples of strings
+        """
+        return [
+            tuple(f"{value:.2f}" if isinstance(value, float) else str(value) for value in row)
+            for row in rows
+        ]
+    
+    def set_rows(self, rows):
+        """
+        Replace all rows of the model.
+        
+        Args:
+            rows (list): Row tuples, one value per column
+        """
+        self.beginResetModel()
+        self.rows = self.format_rows(rows)
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of rows."""
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of columns."""
+        return 0 if parent.isValid() else len(self.headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Return the display text for a cell.
+        
+        Args:
+            index (QModelIndex): Cell index
+            role (int, optional): Data role. Defaults to Qt.DisplayRole.
+        
+        Returns:
+            str: Cell text, or None for unsupported roles
+        """
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        
+        return self.rows[index.row()][index.column()]
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return header labels for columns and 1-based row numbers."""
+        if role != Qt.DisplayRole:
+            return None
+        
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+        
+        return str(section + 1)
\ No newline at end of file